@@ -1,5 +1,6 @@
 """Python3 tool for RDF triples extraction."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -31,24 +32,35 @@ def rdfization(*, project_path: Path = None, project_pkgs: Path = None, project_
     # Retrieve project files
     assert output_dir and download_dir and python3_exec
     project_handler = ProjectHandler(python3_exec)
-    py_source_handler = PySourceHandler()
+    py_source_handler = PySourceHandler(download_dir)
 
-    # If a project on PyPI has been specified, download it locally
-    if pypi_target:
-        assert not project_path and not project_pkgs and not project_deps
-        project_path = project_handler.download_source_from_pypi(pypi_target, download_dir)
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        # Get the Python source if necessary, in the background while retrieving the project
+        python3_src_future = None
+        if not python3_src:
+            py_version = py_source_handler.get_py_executable_version(python3_exec)
+            python3_src_future = executor.submit(py_source_handler.download_python_source, py_version, download_dir)
 
-    # Install the local project, if necessary
-    if not project_pkgs and not project_deps:
-        install_dir = download_dir.joinpath("install")
-        project_name, project_pkgs, project_deps = project_handler.install_local_project(project_path, install_dir)
-    else:
-        project_name = project_handler.get_local_project_name(project_path)
+        # If a project on PyPI has been specified, download it locally
+        if pypi_target:
+            assert not project_path and not project_pkgs and not project_deps
+            project_path = project_handler.download_source_from_pypi(pypi_target, download_dir)
 
-    # Get the Python source if necessary
-    if not python3_src:
-        py_version = py_source_handler.get_py_executable_version(python3_exec)
-        python3_src = py_source_handler.download_python_source(py_version, download_dir)
+        # Install the local project, if necessary
+        if not project_pkgs and not project_deps:
+            install_dir = download_dir.joinpath("install")
+            project_name, project_pkgs, project_deps = project_handler.install_local_project(project_path, install_dir)
+        else:
+            project_name = project_handler.get_local_project_name(project_path)
+
+        if python3_src_future:
+            python3_src = python3_src_future.result()
+    except BaseException:
+        # Do not wait for the Python source download to complete before reporting the failure
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
 
     # Reconstruct the project structure
     project = Project(project_name, project_path, project_pkgs, project_deps, python3_src)
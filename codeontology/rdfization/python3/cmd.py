@@ -130,7 +130,6 @@ def process_args(args: dict) -> int:
         For the arguments specifying folders, the validity of their content is not checked. Just their existence!
 
     """
-    import codeontology
     user_dir: Path = Path(os.path.expanduser("~")).absolute()
     codeontology_folder: Path = user_dir.joinpath("codeontology")
 
@@ -139,7 +138,7 @@ def process_args(args: dict) -> int:
     if input_type == "local":
 
         project_path: Path = args.get("project_path")
-        if not project_path.exists() or not project_path.is_dir():
+        if not project_path.is_dir():
             print("argument 'FOLDER' is not a valid existent folder", file=sys.stderr)
             return False
 
@@ -150,47 +149,42 @@ def process_args(args: dict) -> int:
             print("'--pkgs' and '--deps' must be provided together", file=sys.stderr)
             return False
         if project_pkgs and project_deps:
-            if not project_pkgs.exists() or not project_pkgs.is_dir():
+            if not project_pkgs.is_dir():
                 print("argument 'PKGS' is not a valid existent folder", file=sys.stderr)
                 return False
-            if not project_deps.exists() or not project_deps.is_dir():
+            if not project_deps.is_dir():
                 print("argument 'DEPS' is not a valid existent folder", file=sys.stderr)
                 return False
 
     # Common arguments
+    # Folders are created if missing: `mkdir` fails only if the path exists and is not a folder
     output_dir: Path = args.get("output_dir")
     if output_dir:
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True)
-        elif not output_dir.is_dir():
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except FileExistsError:
             print("argument 'OUTPUT' is not a valid existent folder", file=sys.stderr)
             return False
     else:
-        if not codeontology_folder.exists():
-            codeontology_folder.mkdir(parents=True)
         output_dir = codeontology_folder.joinpath("output")
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
         args["output_dir"] = output_dir
 
     download_dir: Path = args.get("download_dir")
     if download_dir:
-        if not download_dir.exists():
-            download_dir.mkdir(parents=True)
-        elif not download_dir.is_dir():
+        try:
+            download_dir.mkdir(parents=True, exist_ok=True)
+        except FileExistsError:
             print("argument 'DOWNLOAD' is not a valid existent folder", file=sys.stderr)
             return False
     else:
-        if not codeontology_folder.exists():
-            codeontology_folder.mkdir(parents=True)
         download_dir = codeontology_folder.joinpath("download")
-        if not download_dir.exists():
-             download_dir.mkdir(parents=True)
+        download_dir.mkdir(parents=True, exist_ok=True)
         args["download_dir"] = download_dir
 
     python3_exec: Path = args.get("python3_exec")
     if python3_exec:
-        if not python3_exec.exists() or not python3_exec.is_file():
+        if not python3_exec.is_file():
             print("argument 'PY-EXE' cannot be a valid python3 executable", file=sys.stderr)
             return False
     else:
@@ -198,7 +192,7 @@ def process_args(args: dict) -> int:
 
     python3_src: Path = args.get("python3_src")
     if python3_src:
-        if not python3_src.exists() or not python3_src.is_dir():
+        if not python3_src.is_dir():
             print("argument 'PY-SRC' is not a valid existent folder", file=sys.stderr)
             return False
 
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
+import stat
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Set, Tuple, Union
-
-import astroid
+from typing import Any, Dict, Iterator, List, Set, Tuple, TYPE_CHECKING, Union
 
 from codeontology import LOGGER
-from codeontology.ontology import ontology
+
+if TYPE_CHECKING:
+    import astroid
 
 
 class Project:
@@ -25,13 +29,19 @@ class Project:
         dependencies_path (Path): the path to the folder containing the top level packages paths of the project
          dependencies.
         python3_path (Path): the path to the folder containing the Python3 standard library source code.
-        packages (Dict[Path, Package]): a dictionary mapping file `Path`s to their related `Package` in the project.
+        packages (Dict[str, Package]): a dictionary mapping file paths, as strings, to their related `Package` in the
+         project.
         libraries (Set[Library]): the set of libraries (top level packages) of the project distribution.
         dependencies (Set[Library]): the set of libraries (top level packages) of the project dependencies.
         stdlibs (Set[Library]): the set of standard libraries in the Python3 specified source.
         original_sys_path (List[Path]): a copy of the original search paths of the Python executable we are running on.
 
     """
+    # Instances are many and long-lived, so we avoid a `__dict__` for each of them. The 'individual' slot is for the
+    #  ontology individual bound to the object during the triples extraction.
+    __slots__ = ("name", "path", "packages_paths", "dependencies_paths", "python3_path", "packages", "libraries",
+                 "dependencies", "stdlibs", "original_sys_path", "individual", "__hash")
+
     name: str
     path: Path
 
@@ -39,13 +49,15 @@ class Project:
     dependencies_paths: Path
     python3_path: Path
 
-    packages: Dict[Path, Package]
+    packages: Dict[str, Package]
     libraries: Set[Library]
     dependencies: Set[Library]
     stdlibs: Set[Library]
 
     original_sys_path: List[Path]
 
+    __MAX_LIBRARY_WORKERS = 8
+
     def __init__(self, project_name: str, project_path: Path, packages_path: Path, dependencies_path: Path,
                  python3_path: Path):
         """Creates a representation of a Python3 project from the files in the file system.
@@ -71,10 +83,12 @@ class Project:
         # Check input
         if not Project.is_project(project_path):
             raise ValueError(f"Invalid project directory '{project_path}'.")
-        for package_path in packages_path.iterdir():
+        library_paths = list(packages_path.iterdir())
+        for package_path in library_paths:
             if not Library.is_library(package_path):
                 raise ValueError(f"Invalid library '{package_path}'.")
-        for dependency_path in dependencies_path.iterdir():
+        dependency_paths = list(dependencies_path.iterdir())
+        for dependency_path in dependency_paths:
             if not Library.is_library(dependency_path):
                 raise ValueError(f"Invalid dependency '{dependency_path}'.")
         if not Library.is_library(python3_path):
@@ -83,6 +97,7 @@ class Project:
         # Init
         self.name = project_name
         self.path = project_path
+        self.__hash = hash(project_path)
         LOGGER.info(f"Creating object for `Project` '{self.name}' (from '{self.path}').")
 
         self.packages_paths = packages_path
@@ -91,40 +106,42 @@ class Project:
 
         self.packages = dict()
 
-        self.libraries = set()
-        for package_path in packages_path.iterdir():
-            self.libraries.add(Library(package_path, self, True))
-
-        self.dependencies = set()
-        for dependency_path in dependencies_path.iterdir():
-            self.dependencies.add(Library(dependency_path, self, False))
-
-        self.stdlibs = set()
-        for stdlib_path in python3_path.iterdir():
-            if Library.is_library(stdlib_path):
-                self.stdlibs.add(Library(stdlib_path, self, False))
+        # The libraries are independent of each other, so we build them concurrently: the walk of their folders is
+        #  mostly waiting on file system calls, during which the GIL is released. This is the only level of
+        #  parallelism, each library walks its own package tree serially, so the thread count stays bounded
+        stdlib_paths = [stdlib_path for stdlib_path in python3_path.iterdir() if Library.is_library(stdlib_path)]
+        with ThreadPoolExecutor(max_workers=Project.__MAX_LIBRARY_WORKERS) as executor:
+            libraries = executor.map(lambda library_path: Library(library_path, self, True), library_paths)
+            dependencies = executor.map(lambda library_path: Library(library_path, self, False), dependency_paths)
+            stdlibs = executor.map(lambda library_path: Library(library_path, self, False), stdlib_paths)
+            self.libraries = set(libraries)
+            self.dependencies = set(dependencies)
+            self.stdlibs = set(stdlibs)
 
         self.original_sys_path = [Path(p) for p in sys.path]
 
         # !!! Thinking about removing this! Many created packages are not actually referenced by the project source
         #  code, and they won't have related triples: so these are not interesting numbers.
         n_libs = len(self.libraries) + len(self.dependencies) + len(self.stdlibs)
-        n_pkgs = len([pkg for lib in (self.libraries | self.dependencies | self.stdlibs)
-                      for pkg in lib.root_package.get_packages()])
+        n_pkgs = len(self.packages)  # Every `Package` registers itself in the project on creation
         LOGGER.debug(f"Created '{n_libs:,}' `Library` objects and '{n_pkgs:,}' `Package` objects.")
 
     def __hash__(self):
-        return self.path.__hash__()
+        return self.__hash
 
     def __eq__(self, other: Any):
+        if self is other:
+            # Objects are unique for each file system path, so this is by far the most common match
+            return True
         if type(other) is Project:
-            # Leveraging the uniqueness of the file system paths
-            return self.path.resolve().absolute() == other.path.resolve().absolute()
+            # Leveraging the uniqueness of the file system paths, already made absolute when creating the objects
+            return self.path == other.path
         else:
-            raise TypeError(f"Cannot compare '{type(self)}' with type '{type(other)}'.")
+            # Let Python fall back to its default comparison, that tells objects of different types are not equal
+            return NotImplemented
 
     def __str__(self):
-        return str(self.path.resolve().absolute())
+        return str(self.path)
 
     def get_packages(self) -> Iterator[Package]:
         """Get all the packages that are part of the project library.
@@ -136,17 +153,21 @@ class Project:
         for library in self.libraries:
             yield from library.root_package.get_packages()
 
-    def find_package(self, path: Path) -> Package:
+    def find_package(self, path: Union[Path, str]) -> Package:
         """Finds the `Package` related to a file path.
 
         Args:
-            path (Path): path of a file.
+            path (Union[Path, str]): path of a file.
 
         Returns:
             Package: the project `Package` related to that file, or `None` for no matches.
 
+        Notes:
+            Packages are indexed by the string of their paths, which is faster to hash and compare than a `Path`, and
+             lets the paths coming as strings (e.g. from the ASTs) be searched without being converted.
+
         """
-        return self.packages.get(path, None)
+        return self.packages.get(os.fspath(path), None)
 
     def add_or_replace_stdlib_library(self, path: Path):
         """Adds a new standard library `Library` to the project.
@@ -155,15 +176,17 @@ class Project:
             path (Path): the path to the root of the library.
 
         """
-        library_package = self.find_package(path)
-        # Remove previous library trace, if it existed
-        if library_package:
+        # New package files may have been written since their classification was cached
+        Package.clear_file_system_cache()
+
+        # Packages are indexed by their source file, that for a regular package is its '__init__.py' file
+        library_package = self.find_package(path) or self.find_package(path.joinpath(Package.REGULAR_PKG_FILE_ID))
+        # Remove previous library trace, if it existed: the library is reached from its root package, with no need to
+        #  search for it among all the standard libraries
+        if library_package and library_package.library.path == path:
             for package in library_package.get_packages():
-                del self.packages[package.get_ref_path()]
-            for stdlib in set(self.stdlibs):
-                if stdlib.path == path:
-                    self.stdlibs.remove(stdlib)
-                    break
+                del self.packages[os.fspath(package.get_ref_path())]
+            self.stdlibs.discard(library_package.library)
         # Add new library
         self.stdlibs.add(Library(path, self, False))
 
@@ -196,6 +219,8 @@ class Library:
         is_by_project (bool): `True` if the library is declared inside the project, `False` if comes from a dependency.
 
     """
+    __slots__ = ("name", "path", "project", "root_package", "is_by_project", "individual", "__hash")
+
     name: str
     path: Path
 
@@ -215,33 +240,43 @@ class Library:
         Raises:
             ValueError: invalid library.
 
-        """
-        library_path = library_path.resolve().absolute()
+        Notes:
+            The path is not resolved again: libraries are created by their project from the content of its already
+             resolved folders.
 
-        # Check input
-        if not Library.is_library(library_path):
-            raise ValueError(f"Invalid library '{library_path}'.")
+        """
+        library_path = library_path.absolute()
 
         # Init
         self.name = Library.__get_name(library_path)
         self.path = library_path
+        self.__hash = hash(library_path)
 
         self.project = project
-        self.root_package = Package(library_path, self)
+        # Checking `Library.is_library()` here would classify the path exactly as the root `Package` constructor does,
+        #  so we leave the validation of the input to it
+        try:
+            self.root_package = Package(library_path, self)
+        except ValueError as e:
+            raise ValueError(f"Invalid library '{library_path}'.") from e
         self.is_by_project = is_by_project
 
     def __hash__(self):
-        return self.path.__hash__()
+        return self.__hash
 
     def __eq__(self, other):
+        if self is other:
+            # Objects are unique for each file system path, so this is by far the most common match
+            return True
         if type(other) is Library:
-            # Leveraging the uniqueness of the file system paths
-            return self.path.resolve().absolute() == other.path.resolve().absolute()
+            # Leveraging the uniqueness of the file system paths, already made absolute when creating the objects
+            return self.path == other.path
         else:
-            raise TypeError(f"Cannot compare '{type(self)}' with type '{type(other)}'.")
+            # Let Python fall back to its default comparison, that tells objects of different types are not equal
+            return NotImplemented
 
     def __str__(self):
-        return str(self.path.resolve().absolute())
+        return str(self.path)
 
     @staticmethod
     def is_library(file_path: Path) -> bool:
@@ -271,7 +306,7 @@ class Library:
         """
         # for a file '<parent_path>\<file_name>.<ext>' returns '<file_name>'
         # for a folder '<parent_path>\<dir_name>' returns '<dir_name>'
-        return library_path.stem
+        return sys.intern(library_path.stem)
 
 
 class Package:
@@ -295,6 +330,9 @@ class Package:
         For 'namespace package' SEE <https://docs.python.org/3/glossary.html#term-namespace-package>.
 
     """
+    __slots__ = ("simple_name", "full_name", "path", "source", "type", "library", "direct_subpackages", "ast",
+                 "individual", "__hash")
+
     simple_name: str
     full_name: str
     path: Path
@@ -317,8 +355,14 @@ class Package:
 
         Raises:
             ValueError: invalid package.
+
+        Notes:
+            The path is not resolved again: the library resolves its own path, and the paths of the subpackages are
+             listed from the folders of their already resolved parent packages. Resolving every package path would cost
+             a file system call for each part of the path.
+
         """
-        package_path = package_path.resolve().absolute()
+        package_path = package_path.absolute()
 
         # Check input
         package_type = Package.get_package_type(package_path)
@@ -330,30 +374,37 @@ class Package:
         self.path = package_path
         self.source = self.__get_source_path(package_path, package_type)
         self.type = package_type
+        self.__hash = hash(self.get_ref_path())
 
         self.library = library
         self.direct_subpackages = set()
         if package_type is not Package.Type.MODULE:
-            assert self.path.is_dir()
-            for file_path in self.path.iterdir():
-                if Package.is_package(file_path):
-                    self.direct_subpackages.add(Package(file_path, library))
+            # Only folders are classified as `REGULAR` or `NAMESPACE` packages, and their content was already listed
+            #  while classifying them
+            for file_path, is_dir in Package.__scan_folder(self.path):
+                subpackage = Package.__build_subpackage(file_path, is_dir, library)
+                if subpackage is not None:
+                    self.direct_subpackages.add(subpackage)
 
         # Add this package to its owner project
-        self.library.project.packages[self.get_ref_path()] = self
+        self.library.project.packages[os.fspath(self.get_ref_path())] = self
 
         # AST creation is delayed and left for the extraction process.
         self.ast = None
 
     def __hash__(self):
-        return self.get_ref_path().__hash__()
+        return self.__hash
 
     def __eq__(self, other):
+        if self is other:
+            # Objects are unique for each file system path, so this is by far the most common match
+            return True
         if type(other) is Package:
-            # Leveraging the uniqueness of the file system paths
-            return self.get_ref_path().resolve().absolute() == other.get_ref_path().resolve().absolute()
+            # Leveraging the uniqueness of the file system paths, already made absolute when creating the objects
+            return self.get_ref_path() == other.get_ref_path()
         else:
-            raise TypeError(f"Cannot compare '{type(self)}' with type '{type(other)}'.")
+            # Let Python fall back to its default comparison, that tells objects of different types are not equal
+            return NotImplemented
 
     def __str__(self):
         return str(self.get_ref_path())
@@ -381,9 +432,18 @@ class Package:
          (recursively) a `NAMESPACE` package."""
 
     def get_packages(self) -> Iterator[Package]:
-        yield self
-        for subpackage in self.direct_subpackages:
-            yield from subpackage.get_packages()
+        """Get this package and all the packages it contains, at any depth.
+
+        Returns:
+            Iterator[Package]: an iterator over the package and its subpackages.
+
+        """
+        # Visit the package tree through an explicit stack, instead of nesting a generator for each level
+        to_visit_packages = [self]
+        while to_visit_packages:
+            package = to_visit_packages.pop()
+            yield package
+            to_visit_packages.extend(package.direct_subpackages)
 
     @staticmethod
     def is_package(file_path) -> bool:
@@ -402,6 +462,7 @@ class Package:
         return Package.get_package_type(file_path) is not Package.Type.NONE
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def get_package_type(file_path: Path) -> Package.Type:
         """Classifies a file/folder accordingly to the defined type of packages.
 
@@ -414,11 +475,48 @@ class Package:
         Raises:
             ValueError: nonexistent file/folder.
 
+        Notes:
+            Results are cached, since the same paths get classified many times while building a `Project` (when
+             validating libraries, creating packages and recursively searching for namespace packages). The cache is
+             bounded, so that it does not grow for the whole process (an evicted path is just classified again), and
+             has to be cleared with `Package.clear_file_system_cache()` if the files of a package are changed.
+
         """
-        if not file_path.exists():
+        # A single status request tells both if the path exists and if it is a folder
+        try:
+            file_mode = os.stat(file_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(f"Nonexistent file/folder for path '{file_path}'.")
 
-        if file_path.is_file():
+        return Package.__get_entry_package_type(file_path, stat.S_ISDIR(file_mode))
+
+    @staticmethod
+    def clear_file_system_cache():
+        """Clears the cached classifications of files/folders (including project folders), and the cached content of
+         folders.
+
+        """
+        from codeontology.rdfization.python3.explore.utils import ProjectHandler
+        ProjectHandler.is_project_dir.cache_clear()
+        Package.get_package_type.cache_clear()
+        Package.__get_entry_package_type.cache_clear()
+        Package.__scan_folder.cache_clear()
+        Package.__get_library_prefix_length.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def __get_entry_package_type(file_path: Path, is_dir: bool) -> Package.Type:
+        """Classifies an existing file/folder accordingly to the defined type of packages.
+
+        Args:
+            file_path (Path): the path to the existing file/folder to check.
+            is_dir (bool): `True` if the path is a folder, `False` if it is a file.
+
+        Returns:
+            Package.Type: the kind of package the path matches with.
+
+        """
+        if not is_dir:
             if file_path.name == Package.REGULAR_PKG_FILE_ID:
                 # This is because "__init_.py" files are strictly bounded to the folder, and treated in a special way
                 #  by the Python interpreter. Since we are linking the "__init__.py" file to the folder, we have to
@@ -427,15 +525,35 @@ class Package:
             if file_path.suffix == ".py":
                 return Package.Type.MODULE
         else:
-            assert file_path.is_dir()
-            for sub_file_path in file_path.iterdir():
+            sub_file_entries = Package.__scan_folder(file_path)
+            for sub_file_path, _ in sub_file_entries:
                 if sub_file_path.name == Package.REGULAR_PKG_FILE_ID:
                     return Package.Type.REGULAR
-            for sub_file_path in file_path.iterdir():
-                if Package.get_package_type(sub_file_path) is not Package.Type.NONE:
+            for sub_file_path, sub_is_dir in sub_file_entries:
+                if Package.__get_entry_package_type(sub_file_path, sub_is_dir) is not Package.Type.NONE:
                     return Package.Type.NAMESPACE
         return Package.Type.NONE
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __scan_folder(folder_path: Path) -> Tuple[Tuple[Path, bool], ...]:
+        """Lists the content of a folder, telling for each entry whether it is a folder or not.
+
+        Args:
+            folder_path (Path): the path to the folder.
+
+        Returns:
+            Tuple[Tuple[Path, bool], ...]: a pair for each file/folder in the folder, with its path and `True` if it is
+             a folder.
+
+        Notes:
+            Results are cached, since a folder content is needed both to classify the package and to build its
+             subpackages. The kind of each entry is known from the listing itself, without any further file system call.
+
+        """
+        with os.scandir(folder_path) as dir_entries:
+            return tuple((Path(dir_entry.path), dir_entry.is_dir()) for dir_entry in dir_entries)
+
     @staticmethod
     def __get_name(package_path: Path, library: Library) -> Tuple[str, str]:
         """Gets the name of the library from its file/folder.
@@ -451,12 +569,52 @@ class Package:
             ValueError: package not in library.
 
         """
-        if not str(package_path).startswith(str(library.path)):
+        # The path has to be the library one or be inside it, so the prefix must end with a separator (otherwise
+        #  '/foo/barbaz' would be accepted as part of the library in '/foo/bar')
+        package_path_str = os.fspath(package_path)
+        library_path_str = os.fspath(library.path)
+        if package_path_str != library_path_str and \
+                not package_path_str.startswith(os.path.join(library_path_str, "")):
             raise ValueError(f"Package '{package_path}' not in Library '{library.path}'.")
-        simple_name = package_path.stem
-        full_name = ".".join(package_path.parent.joinpath(package_path.stem).parts[len(library.path.parts) - 1:])
+        # Simple names repeat a lot across libraries (e.g. 'utils', 'tests', 'compat'), so a single copy is kept
+        simple_name = sys.intern(package_path.stem)
+        # The full name is made of the parts of the path starting from the library one, computed slicing the strings of
+        #  the paths instead of building new paths and their parts
+        relative_parent = os.fspath(package_path.parent)[Package.__get_library_prefix_length(library.path):]
+        full_name = f"{relative_parent.replace(os.sep, '.')}.{simple_name}" if relative_parent else simple_name
         return simple_name, full_name
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def __get_library_prefix_length(library_path: Path) -> int:
+        """Gets the length of the path of the folder containing a library, with its trailing separator.
+
+        Args:
+            library_path (Path): the path to the file/folder containing the library source.
+
+        Returns:
+            int: the length of the prefix shared by the paths of all the packages of the library, before their names.
+
+        """
+        return len(os.path.join(os.fspath(library_path.parent), ""))
+
+    @staticmethod
+    def __build_subpackage(file_path: Path, is_dir: bool, library: Library) -> Union[Package, None]:
+        """Creates the representation of a file/folder contained in a package, if it is a package itself.
+
+        Args:
+            file_path (Path): the path to the file/folder contained in the package.
+            is_dir (bool): `True` if the path is a folder, `False` if it is a file.
+            library (Library): the library of which the package is part of.
+
+        Returns:
+            Union[Package, None]: the package, or `None` if the path is not a package.
+
+        """
+        if Package.__get_entry_package_type(file_path, is_dir) is Package.Type.NONE:
+            return None
+        return Package(file_path, library)
+
     @staticmethod
     def __get_source_path(package_path: Path, package_type: Package.Type) -> Path:
         """Gets the path to the source file related to a package.
@@ -2,16 +2,34 @@
 
 from __future__ import annotations
 
+import email.parser
+import functools
+import json
+import os
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.version import InvalidVersion, Version
 from pathlib import Path
 import re as regex
-import requests
 import shutil
 import subprocess
 import sys
-from typing import Dict, List, Set, Tuple
+import tempfile
+import time
+from typing import Dict, List, Pattern, Set, Tuple, TYPE_CHECKING, Union
 
 from codeontology import LOGGER
 
+if TYPE_CHECKING:
+    import requests
+    import tarfile
+
+COPY_BUFFER_SIZE: int = 1024 * 1024
+"""Size of the chunks (in bytes) used when copying downloaded data to files, and when reading and extracting tar
+ archives (instead of the 10-16 KiB default buffers of `tarfile`)."""
+
+REGEX_PACKAGE_NAME: Pattern = regex.compile(r"[A-Za-z_]+")
+"""Pattern of the names accepted for packages found in installation folders, compiled once for all the checks."""
+
 
 class ProjectHandler:
     """A handler for Python3 projects.
@@ -26,7 +44,16 @@ class ProjectHandler:
     """
     py3_exec: Path
 
-    __CONFIG_FILES: Set[str] = ["setup.py", "setup.cfg", "pyproject.toml"]
+    __downloaded_sources: Dict[Tuple[str, str], Path]
+
+    __CONFIG_FILES: Set[str] = {"setup.py", "setup.cfg", "pyproject.toml"}
+    __PYPI_JSON_URL: str = "https://pypi.org/pypi/{}/json"
+    __REGEX_PROJECT_NAME: Pattern = regex.compile(r"[a-zA-Z][a-zA-Z0-9._\-]*")
+    __REGEX_TAR_ARCHIVE: Pattern = regex.compile(r"\.(tar|tar\.gz|tgz|tar\.bz2|tar\.xz)$")
+    __REGEX_PIP_INSTALLED: Pattern = regex.compile(
+        r"^(?:Successfully installed|Would install) (?P<distributions>.+?)\s*$",
+        regex.MULTILINE
+    )
 
     def __init__(self, python3_exec: Path = Path(sys.executable)):
         """Create a Python3 project handler.
@@ -37,6 +64,7 @@ class ProjectHandler:
 
         """
         self.py3_exec = python3_exec.resolve().absolute()
+        self.__downloaded_sources = dict()
 
     def install_local_project(self, project_dir: Path, install_dir: Path) -> Tuple[str, Path, Path]:
         """Identify the source code of a properly packaged project (according to PyPA specs) and download all of its
@@ -66,7 +94,8 @@ class ProjectHandler:
         if not ProjectHandler.is_project_dir(project_dir):
             raise ValueError("Invalid project folder.")
         if install_dir.exists():
-            if len(set(install_dir.iterdir())) > 0:
+            # Stop at the first entry, no need to list the whole folder to know it is not empty
+            if any(install_dir.iterdir()):
                 raise ValueError("Non empty install directory.")
         else:
             install_dir.mkdir()
@@ -88,33 +117,52 @@ class ProjectHandler:
         ]
         LOGGER.info(f"Installing project in '{install_dir}'.")
         LOGGER.debug(f"Sub-processing command <{' '.join(command_list)}>.")
-        process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        out, err = process.communicate()
+        # Only the output is parsed, the error stream is not even collected
+        process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        out, _ = process.communicate()
         if process.returncode != 0:
             raise InstallError(f"Unable to install project from '{project_dir}'.")
 
         # HACK should be better to get the name from the configuration file, but this way it is just easier.
-        project_name = regex.search(r"(?<=Successfully installed ).*?(?=\\r\\n)", str(out)).group()
+        project_name = ProjectHandler.__get_pip_installed_distributions(out)
+        if project_name is None:
+            raise InstallError(f"Unable to retrieve the name of the project installed from '{project_dir}'.")
         if " " in project_name:
             raise InstallError(f"Unexpected result! More than one distribution installed: '{project_name}'.")
         # NOTE Focusing only on distribution packages, ignoring 'test' or other kind of development packages
         project_pkg_dirs = ProjectHandler.get_packages_from_installation_dir(install_dir_tmp)
         LOGGER.info(f"Installed project '{project_name}'.")
 
-        # Install the project with its dependencies, to determine which folders and files are dependency packages
-        command_list.pop(-1)  # remove the 'no dependencies' option
-        LOGGER.info(f"Installing project with its dependencies in '{install_dir}'.")
-        LOGGER.debug(f"Sub-processing command <{' '.join(command_list)}>.")
-        process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        _, err = process.communicate()
-        if process.returncode != 0:
-            raise InstallError(f"Unable to install dependencies of project '{project_name}': {str(err)}.")
+        # Install only the dependencies, as declared in the metadata of the installed project, in a separate folder:
+        #  the project is not built a second time, and all the packages found there are dependency packages
+        requirements = ProjectHandler.__get_installed_requirements(install_dir_tmp)
+        install_dir_deps_tmp = install_dir.joinpath("tmp-deps")
+        install_dir_deps_tmp.mkdir()
+        if requirements:
+            command_list = [
+                str(self.py3_exec),
+                "-m", "pip",
+                "install", *requirements,
+                "-t", str(install_dir_deps_tmp),
+                "--no-cache-dir",  # no use of caches
+            ]
+            LOGGER.info(f"Installing dependencies of project '{project_name}' in '{install_dir}'.")
+            LOGGER.debug(f"Sub-processing command <{' '.join(command_list)}>.")
+            process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            _, err = process.communicate()
+            if process.returncode != 0:
+                raise InstallError(f"Unable to install dependencies of project '{project_name}': {str(err)}.")
 
         # TODO add a way to add dependencies from reading the import statements in the packages. Some modules, like
         #  testing modules, do import libraries that are not declared in the configuration dependencies, since they
         #  contain code supposed to be run only for testing and not for normal use. This way we are missing the chance
         #  to get their triples.
-        dependencies_pkg_dirs = ProjectHandler.get_packages_from_installation_dir(install_dir_tmp) - project_pkg_dirs
+        # A dependency could in turn require the project itself, that has then to be left out
+        project_pkg_names = {file.name for file in project_pkg_dirs}
+        dependencies_pkg_dirs = {
+            file for file in ProjectHandler.get_packages_from_installation_dir(install_dir_deps_tmp)
+            if file.name not in project_pkg_names
+        }
 
         # Move the packages and dependencies in ad-hoc folders
         project_pkg_folder = install_dir.joinpath("project")
@@ -128,6 +176,7 @@ class ProjectHandler:
         for file in dependencies_pkg_dirs:
             file.rename(dependencies_pkg_folder.joinpath(file.name))
         shutil.rmtree(install_dir_tmp)
+        shutil.rmtree(install_dir_deps_tmp)
 
         return project_name, project_pkg_folder, dependencies_pkg_folder
 
@@ -165,13 +214,16 @@ class ProjectHandler:
         ]
         LOGGER.info(f"Retrieving project name.")
         LOGGER.debug(f"Sub-processing command <{' '.join(command_list)}>.")
-        process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        out, err = process.communicate()
+        # Only the output is parsed, the error stream is not even collected
+        process = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        out, _ = process.communicate()
         if process.returncode != 0:
             raise InstallError(f"Unable to retrieve project name from '{project_dir}'.")
 
         # HACK should be better to get the name from the configuration file, but this way it is just easier.
-        project_name = regex.search(r"(?<=Would install ).*?(?=\\r\\n)", str(out)).group()
+        project_name = ProjectHandler.__get_pip_installed_distributions(out)
+        if project_name is None:
+            raise InstallError(f"Unable to retrieve project name from '{project_dir}'.")
         if " " in project_name:
             raise InstallError(f"Unexpected result! More than one distribution installed: '{project_name}'.")
 
@@ -189,79 +241,140 @@ class ProjectHandler:
             Path: the path to the folder that will contain the source code of the project.
 
         Raises:
-            ValueError: invalid download directory, project name or version.
-            DownloadError: unable to download from PyPI.
+            ValueError: invalid download directory or project name.
+            DownloadError: unable to download from PyPI, such as for a nonexistent project or version.
 
         Notes:
-            This method makes use of the download functionality offered by the 'pip' module, which seems to be not very
-             reliable. The 'download' option for the source code seems to trigger some unwanted and unexpected build
-             steps that may bring to a fail, even where the 'install' option would succeed! Check the link
-             <https://github.com/pypa/pip/issues/8387> and <https://github.com/pypa/pip/issues/7995>.
+            Only the 'source distribution' (sdist) of the project is downloaded, directly from the file URL listed by
+             the PyPI JSON API <https://warehouse.pypa.io/api-reference/json.html>. We don't rely on the 'download'
+             option of 'pip', since it may trigger some unwanted and unexpected build steps that may bring to a fail,
+             check the link <https://github.com/pypa/pip/issues/8387> and <https://github.com/pypa/pip/issues/7995>.
             We don't just use the 'install' option because it does not provide the source version of the code, not
              providing the 'configuration' file or other 'test' folders that may be of interest.
-            The 'pip' module has been used accordingly to what stated in
-             <https://pip.pypa.io/en/stable/user_guide/#using-pip-from-your-program>.
 
         """
         download_dir = download_dir.resolve().absolute()
 
-        # Split the target in name and version of the project
-        project_target += "=="
-        project_name, project_version = project_target.split("==")[:2]
-
         # Check input
         if not download_dir.is_dir():
             raise ValueError(f"Specified folder '{download_dir}' is not a valid directory.")
+
+        # Split the target in name and version of the project
+        try:
+            requirement = Requirement(project_target)
+        except InvalidRequirement as e:
+            raise ValueError(f"Invalid project target '{project_target}'.") from e
+        # Only a name and a version are meaningful to look for a release on PyPI: anything else would be ignored
+        if requirement.url or requirement.marker or requirement.extras:
+            raise ValueError(f"Invalid project target '{project_target}', URLs, extras and markers are not supported.")
+        project_name = requirement.name
         if not ProjectHandler.is_valid_project_name(project_name):
             raise ValueError(f"Invalid project name '{project_name}' in specified target '{project_target}'.")
-        available_versions = self.get_project_versions(project_name)
-        if not available_versions:
-            raise ValueError(f"Project name '{project_name}' not available from PyPI.")
-        if project_version and project_version not in available_versions:
-            raise ValueError(f"Specified project version '{project_version}' not available from PyPI.")
-        if not project_version:
-            project_version = available_versions[0]
-
-        # Download only the project source archive
-        download_target = f"{project_name}=={project_version}"
-        pre_download_dir_content = set(download_dir.iterdir())
-        command_list = [
-            str(self.py3_exec),
-            "-m", "pip",
-            "download", download_target,
-            "-d", str(download_dir),
-            "--no-deps",  # no dependencies
-            "--no-binary", ":all:",  # no distributions, source code
-            "--no-cache-dir",  # no use of caches, no track of the download on your venv
-        ]
-        LOGGER.info(f"Downloading '{download_target}' sources in '{download_dir}'.")
-        LOGGER.debug(f"Sub-processing command <{' '.join(command_list)}>.")
-        process = subprocess.Popen(
-            command_list,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        _, _ = process.communicate()
-        if process.returncode != 0:
+        project_versions = [specifier.version for specifier in requirement.specifier if specifier.operator == "=="]
+        if len(project_versions) != len(requirement.specifier) or len(project_versions) > 1:
+            raise ValueError(f"Invalid version clause in specified target '{project_target}', only a single 'version"
+                             f" matching' clause ('==') is supported.")
+        project_version = project_versions[0] if project_versions else ""
+
+        download_target = f"{project_name}=={project_version}" if project_version else project_name
+
+        # Skip the download if we already retrieved the same project version
+        source_path = self.__downloaded_sources.get((project_name, project_version), None)
+        if source_path and source_path.exists():
+            LOGGER.info(f"Reusing '{download_target}' sources already downloaded in '{source_path}'.")
+            return source_path
+
+        # Find the source distribution of the requested version (the latest one if not specified)
+        project_info = self.__get_project_info(project_name)
+        if project_info is None:
+            raise DownloadError(f"Unable to download '{download_target}' from PyPI, the project does not exist.")
+        release_version = project_version if project_version else project_info["version"]
+        sdist_files = project_info["sdists"].get(release_version, None)
+        if sdist_files is None and parse_version(release_version) is not None:
+            # The version may be specified in a different, but equivalent, form (e.g. '1.0' for '1.0.0')
+            for version, files in project_info["sdists"].items():
+                if parse_version(version) == parse_version(release_version):
+                    sdist_files = files
+                    break
+        if sdist_files is None:
+            raise DownloadError(f"Unable to download '{download_target}' from PyPI, the version does not exist.")
+        if not sdist_files:
             raise DownloadError(
-                f"Unable to download '{download_target}' from PyPI as source. Probably only wheels packages"
-                f" are available. Try to manually download the source code and try again with the `local` option."
+                f"Unable to download '{download_target}' from PyPI as source, probably only wheels packages are"
+                f" available. Try to manually download the source code and try again with the `local` option."
             )
 
-        # Find the downloaded source archive
-        archive_path = set(download_dir.iterdir()) - pre_download_dir_content
-        assert len(archive_path) == 1
-        archive_path = archive_path.pop()
-
-        # Extract the archive content then delete it
-        shutil.unpack_archive(archive_path, download_dir)
-        archive_path.unlink()
-        source_path = set(download_dir.iterdir()) - pre_download_dir_content
-        assert len(source_path) == 1
-        source_path = source_path.pop()
+        # Download and extract the source archive. Tar archives are extracted while they are downloaded, without
+        #  storing them, while any other format (e.g. zip archives of older releases) needs a temporary archive file.
+        #  Everything happens in a temporary folder of its own, so that a failure leaves nothing behind.
+        sdist_url, sdist_filename = sdist_files[0]["url"], sdist_files[0]["filename"]
+        LOGGER.info(f"Downloading '{project_name}=={release_version}' sources in '{download_dir}'.")
+        sdist_sha256 = sdist_files[0]["sha256"]
+        extract_dir = Path(tempfile.mkdtemp(dir=download_dir))
+        try:
+            if ProjectHandler.__REGEX_TAR_ARCHIVE.search(sdist_filename):
+                download_and_extract_tar(sdist_url, extract_dir, sha256=sdist_sha256)
+            else:
+                archive_path = extract_dir.joinpath(sdist_filename)
+                download_file(sdist_url, archive_path, sha256=sdist_sha256)
+                extract_archive(archive_path, extract_dir)
+                archive_path.unlink()
+            extracted_paths = list(extract_dir.iterdir())
+            if len(extracted_paths) != 1:
+                raise DownloadError(
+                    f"Unexpected source archive content, '{sdist_filename}' has no single top folder."
+                )
+            source_path = download_dir.joinpath(extracted_paths[0].name)
+            if source_path.exists():
+                LOGGER.debug(f"Replacing previously downloaded sources in '{source_path}'.")
+                shutil.rmtree(source_path)
+            shutil.move(extracted_paths[0], source_path)
+            self.__downloaded_sources[(project_name, project_version)] = source_path
+        finally:
+            # Whatever the failure, never leave partially extracted content in the download folder
+            shutil.rmtree(extract_dir, ignore_errors=True)
 
         return source_path
 
+    @staticmethod
+    def __get_installed_requirements(install_dir: Path) -> List[str]:
+        """Reads the requirements declared by the single distribution installed in a folder.
+
+        Args:
+            install_dir (Path): the directory in which the distribution has been installed.
+
+        Returns:
+            List[str]: the 'Requires-Dist' entries of the distribution metadata, environment markers included.
+
+        Raises:
+            InstallError: unable to find the metadata of the installed distribution.
+
+        Notes:
+            Markers are left to 'pip' to be evaluated, against the environment of the target Python3 executable.
+
+        """
+        metadata_files = list(install_dir.glob("*.dist-info/METADATA"))
+        if len(metadata_files) != 1:
+            raise InstallError(f"Unable to retrieve the metadata of the distribution installed in '{install_dir}'.")
+        with open(metadata_files[0], "r", encoding="utf8") as f:
+            metadata = email.parser.HeaderParser().parse(f)
+        return metadata.get_all("Requires-Dist", [])
+
+    @staticmethod
+    def __get_pip_installed_distributions(pip_output: bytes) -> Union[str, None]:
+        """Finds the distributions reported as (to be) installed in the output of a 'pip install' command.
+
+        Args:
+            pip_output (bytes): the standard output of the 'pip install' process.
+
+        Returns:
+            Union[str, None]: the space separated names of the installed distributions (each one as '<name>-<version>'),
+             as reported by 'pip'; `None` if not found.
+
+        """
+        match = ProjectHandler.__REGEX_PIP_INSTALLED.search(pip_output.decode(errors="replace"))
+        return match.group("distributions") if match else None
+
     @staticmethod
     def get_config_file_content(project_dir: Path) -> Dict:
         """Reads the configuration file/s of a project to extract the distribution info.
@@ -284,13 +397,38 @@ class ProjectHandler:
             Actually unused, but may be useful, or even of better use, in those parts where some information is
              extracted looking at the 'pip' module output.
 
+        """
+        project_dir = project_dir.resolve().absolute()
+
+        setup_path = project_dir.joinpath(f"setup.py")
+        if not setup_path.exists():
+            return dict()
+        # Reading the setup file is expensive, so reuse the content read the last time if the file has not been
+        #  modified since
+        return dict(ProjectHandler.__read_setup_file(setup_path, setup_path.stat().st_mtime))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __read_setup_file(setup_path: Path, setup_mtime: float) -> Dict:
+        """Reads the keywords passed to the 'setup' call of a setup file.
+
+        Args:
+            setup_path (Path): the path to the 'setup.py' file.
+            setup_mtime (float): the last modification time of the setup file, used just to discard the cached content
+             of modified files.
+
+        Returns:
+            Dict: a dictionary containing an entry for each of the keywords passed to the 'setup' call. It must not be
+             modified, since it is shared.
+
+        Raises:
+            SetupReadingError: unable to securely read the setup file.
+
         """
         from contextlib import contextmanager
         from importlib import import_module
         import os
-        import setuptools
         import sys
-        from unittest import mock
 
         @contextmanager
         def safe_setup_read(setup_dir: Path):
@@ -317,17 +455,20 @@ class ProjectHandler:
                     #  setups for other projects
                     del sys.modules["setup"]
 
-        project_dir = project_dir.resolve().absolute()
-
-        # Use mocking and a context manager to read the setup file content securely
-        # SEE mocking at https://stackoverflow.com/a/24236320/13640701
-        # SEE context manager at https://stackoverflow.com/a/37996581/13640701
-        # SEE stop setup prints at https://stackoverflow.com/a/10321751/13640701
-        setup_path = project_dir.joinpath(f"setup.py")
-        config_dict = dict()
         LOGGER.info(f"Reading setup file '{setup_path}'.")
-        if setup_path.exists():
-            with safe_setup_read(project_dir), \
+        # Most setup files just pass literals to the 'setup' call, so try to read them without executing anything
+        config_dict = ProjectHandler.__read_setup_keywords_statically(setup_path)
+        if config_dict is None:
+            LOGGER.debug(f"Setup file '{setup_path}' cannot be read statically, importing it.")
+            # Importing 'setuptools' is expensive too, so it happens only when the setup file has to be executed
+            import setuptools
+            from unittest import mock
+
+            # Use mocking and a context manager to read the setup file content securely
+            # SEE mocking at https://stackoverflow.com/a/24236320/13640701
+            # SEE context manager at https://stackoverflow.com/a/37996581/13640701
+            # SEE stop setup prints at https://stackoverflow.com/a/10321751/13640701
+            with safe_setup_read(setup_path.parent), \
                     mock.patch.object(setuptools, "setup") as mock_setup:
                 try:
                     # IDEA Another option could be to use subprocess to read it
@@ -337,13 +478,57 @@ class ProjectHandler:
                     _, config_dict = mock_setup.call_args
                     # conf_dict = read_configuration(self.__PROJECT_CONF_FILE)  # may be useful, but not yet
                 except Exception as e:
-                    LOGGER.warning(f"Bare except clause with observed type '{type(e)}' in `get_config_file_content`.")
+                    LOGGER.warning(f"Bare except clause with observed type '{type(e)}' in"
+                                   f" `get_config_file_content`.")
                     raise SetupReadingError(f"Unable to securely read the '{setup_path.resolve().absolute()}' file"
                                             f" content.")
 
         return config_dict
 
     @staticmethod
+    def __read_setup_keywords_statically(setup_path: Path) -> Union[Dict, None]:
+        """Reads the keywords passed to the 'setup' call of a setup file from its AST, without executing it.
+
+        Args:
+            setup_path (Path): the path to the 'setup.py' file.
+
+        Returns:
+            Union[Dict, None]: a dictionary with an entry for each of the keywords passed to the 'setup' call, `None` if
+             they cannot be determined statically, such as when the file does not contain exactly one 'setup' call, or
+             when any of its arguments is not a literal.
+
+        """
+        import ast
+
+        try:
+            with open(setup_path, "rb") as f:
+                setup_ast = ast.parse(f.read(), filename=str(setup_path))
+        except (SyntaxError, ValueError):
+            return None
+
+        setup_calls = [
+            node for node in ast.walk(setup_ast)
+            if isinstance(node, ast.Call) and (
+                (isinstance(node.func, ast.Name) and node.func.id == "setup") or
+                (isinstance(node.func, ast.Attribute) and node.func.attr == "setup")
+            )
+        ]
+        if len(setup_calls) != 1 or setup_calls[0].args:
+            return None
+
+        config_dict = dict()
+        for keyword in setup_calls[0].keywords:
+            if keyword.arg is None:
+                # Unpacking of a dictionary ('**kwargs')
+                return None
+            try:
+                config_dict[keyword.arg] = ast.literal_eval(keyword.value)
+            except (ValueError, TypeError, SyntaxError):
+                return None
+        return config_dict
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
     def is_project_dir(folder_path: Path) -> bool:
         """Identifies a folder as a Python3 project folder.
 
@@ -360,16 +545,21 @@ class ProjectHandler:
         Raises:
             ValueError: nonexistent folder.
 
+        Notes:
+            Results are cached, so the cache has to be cleared with `Package.clear_file_system_cache()` if the
+             configuration files of a folder are changed.
+
         """
         folder_path = folder_path.resolve().absolute()
-        if not folder_path.exists():
+        # Only the names of the entries are needed, so the listing is enough and no entry is ever stat-ed
+        try:
+            file_names = os.listdir(folder_path)
+        except FileNotFoundError:
             raise ValueError(f"Nonexistent folder '{folder_path}'.")
-        for file in folder_path.iterdir():
-            if file.name in ProjectHandler.__CONFIG_FILES:
-                return True
-        return False
+        return not ProjectHandler.__CONFIG_FILES.isdisjoint(file_names)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def is_valid_project_name(project_name: str) -> bool:
         """Determines if a project name is a valid one, according to PyPI specifics.
 
@@ -384,7 +574,7 @@ class ProjectHandler:
              naming conventions.
 
         """
-        return bool(regex.match(r"[a-zA-Z][a-zA-Z0-9._\-]*", project_name))
+        return bool(ProjectHandler.__REGEX_PROJECT_NAME.fullmatch(project_name))
 
     def is_existing_project(self, project_name: str, project_version: str = "") -> bool:
         """Determines whether a project (with a optional specifiable version) exists on PyPI.
@@ -397,14 +587,15 @@ class ProjectHandler:
             bool: `True` if the the project, eventually with that specified version, exists on PyPI; `False` otherwise.
 
         Raises:
-            PipError: unable to communicate with PyPI.
+            DownloadError: unable to communicate with PyPI.
 
         """
         available_versions = self.get_project_versions(project_name)
         # return available_versions and ((project_version in available_versions) if project_version else True)
         if available_versions:
             if project_version:
-                return project_version in available_versions
+                project_version = parse_version(project_version)
+                return any(parse_version(version) == project_version for version in available_versions)
             else:
                 return True
         else:
@@ -417,41 +608,82 @@ class ProjectHandler:
             project_name (str): the name of the project in the PyPI index.
 
         Returns:
-            List[str]: the list of identified project versions.
+            List[str]: the list of identified project versions, from the most recent to the oldest. Empty if the project
+             does not exist.
 
         Raises:
-            PipError: unable to communicate with PyPI.
+            DownloadError: unable to communicate with PyPI.
 
         Notes:
-            This method makes use of the functionalities offered by the 'pip' module, and it has been used accordingly
-             to what stated in <https://pip.pypa.io/en/stable/user_guide/#using-pip-from-your-program>.
+            Releases without any uploaded file, or whose version does not comply with PEP 440, are not listed (just like
+             'pip index versions' does).
 
         """
-        command_list = [
-            str(self.py3_exec),
-            "-m", "pip",
-            "index", "versions", project_name
-        ]
         LOGGER.info(f"Accessing availables '{project_name}' versions.")
-        LOGGER.debug(f"Sub-processing command <{' '.join(command_list)}>.")
-        process = subprocess.Popen(
-            command_list,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        out, _ = process.communicate()
-
-        if process.returncode != 0:
-            raise PipError(f"Unable to communicate with PyPI about project '{project_name}'.")
+        project_info = self.__get_project_info(project_name)
+        if project_info is None:
+            return []
 
-        versions = []
-        if process.returncode == 0:
-            out = str(out).split("\\r\\n")[1]
-            assert out.startswith("Available versions: ")  # TODO change with raise
-            versions = out.split(": ")[1].split(", ")
+        versions = [version for version in project_info["versions"] if parse_version(version) is not None]
+        versions.sort(key=parse_version, reverse=True)
 
         return versions
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __get_project_info(project_name: str) -> Union[Dict, None]:
+        """Requests the metadata of a project, along with the files of all its releases, to the PyPI JSON API.
+
+        Args:
+            project_name (str): the name of the project in the PyPI index.
+
+        Returns:
+            Union[Dict, None]: `None` if the project does not exist, otherwise a dictionary with the latest version of
+             the project ('version'), the versions of the releases with any uploaded file ('versions'), and the source
+             distributions files of each release ('sdists', each one as a dictionary with its 'url', 'filename' and
+             'sha256'). It must not be modified, since it is shared.
+
+        Raises:
+            DownloadError: unable to communicate with PyPI.
+
+        Notes:
+            Results are cached, so that checking the versions of a project and then downloading it costs a single
+             request. Failed requests are not cached. Only the needed metadata is kept, since the whole response lists
+             every file of every release, and may weigh several MB for large projects.
+
+        """
+        import requests
+
+        url = ProjectHandler.__PYPI_JSON_URL.format(project_name)
+        LOGGER.debug(f"Requesting <{url}>.")
+        try:
+            response = get_http_session().get(url, timeout=30)
+            if response.status_code == 404:
+                return None
+            if not response.status_code == 200:
+                raise DownloadError(f"Unable to communicate with PyPI about project '{project_name}'.")
+            project_info = response.json()
+        except requests.RequestException as e:
+            raise DownloadError(f"Unable to communicate with PyPI about project '{project_name}': {e}.") from e
+
+        sdists = {
+            version: [
+                {
+                    "url": release_file["url"],
+                    "filename": release_file["filename"],
+                    "sha256": release_file.get("digests", {}).get("sha256", None)
+                }
+                for release_file in release_files
+                if release_file.get("packagetype", None) == "sdist" and not release_file.get("yanked", False)
+            ]
+            for version, release_files in project_info["releases"].items()
+        }
+        return {
+            "version": project_info["info"]["version"],
+            "versions": [version for version, release_files in project_info["releases"].items() if release_files],
+            "sdists": sdists
+        }
+
     @staticmethod
     def get_packages_from_installation_dir(install_dir: Path) -> Set[Path]:
         """Identifies the installed packages from an installation directory.
@@ -469,12 +701,17 @@ class ProjectHandler:
         install_dir = install_dir.resolve().absolute()
         installed_distr_paths: Set[Path] = set()
 
-        # Scroll all the files in the installation directory
-        for file in install_dir.iterdir():
+        # Scroll all the files in the installation directory, once: the listing also tells which entries are folders
+        #  (with no additional `stat` call on most platforms), and the names are then enough to probe for packages
+        with os.scandir(install_dir) as dir_entries:
+            entries = list(dir_entries)
+        entry_names = {entry.name for entry in entries}
+        for entry in entries:
             # The `pip install` command creates some folders ending with '-info' that are not Python packages and
             #  instead contain metadata about the installed distribution. We can leverage this folders!
-            if file.name.endswith("-info"):
-                assert file.is_dir()
+            if entry.name.endswith("-info"):
+                assert entry.is_dir()
+                file = install_dir.joinpath(entry.name)
                 lib_distr_paths = set()
                 # We scroll all the metadata files.
                 for metadata_file in file.iterdir():
@@ -506,24 +743,32 @@ class ProjectHandler:
                         with open(metadata_file, "r", encoding="utf8") as f:
                             for line in f.readlines():
                                 top_package_name = line.strip()
-                                if top_package_name:
-                                    package_path_folder = install_dir.joinpath(top_package_name)
+                                if not top_package_name:
+                                    continue
+                                if "/" not in top_package_name:
+                                    if top_package_name in entry_names:
+                                        lib_distr_paths.add(install_dir.joinpath(top_package_name))
+                                    if top_package_name + ".py" in entry_names:
+                                        lib_distr_paths.add(install_dir.joinpath(top_package_name + ".py"))
+                                else:
+                                    # Nested packages (e.g. 'google/protobuf') are not in the listing of the
+                                    #  installation directory, so they are looked up on the file system
+                                    package_path_folder = install_dir.joinpath(*top_package_name.split("/"))
                                     if package_path_folder.exists():
                                         lib_distr_paths.add(package_path_folder)
-                                    package_path_file = install_dir.joinpath(top_package_name + ".py")
+                                    package_path_file = package_path_folder.with_name(package_path_folder.name + ".py")
                                     if package_path_file.exists():
                                         lib_distr_paths.add(package_path_file)
 
                 # If we found none of the useful metadata files, we infer the top level packages paths from the name of
                 #  the metadata folder.
                 if not lib_distr_paths:
-                    package_dir = install_dir.joinpath(file.name.split("-")[0])
-                    package_file = install_dir.joinpath(file.name.split("-")[0] + ".py")
-                    if package_dir.exists():
-                        installed_distr_paths.add(package_dir)
-                    if package_file.exists():
-                        installed_distr_paths.add(package_file)
-                    if not package_dir.exists() and not package_file.exists():
+                    package_name = entry.name.split("-")[0]
+                    if package_name in entry_names:
+                        installed_distr_paths.add(install_dir.joinpath(package_name))
+                    if package_name + ".py" in entry_names:
+                        installed_distr_paths.add(install_dir.joinpath(package_name + ".py"))
+                    if package_name not in entry_names and package_name + ".py" not in entry_names:
                         raise InstallError(f"Impossible to find packages related to distribution info in '{file}'.")
                 else:
                     for path in lib_distr_paths:
@@ -540,14 +785,30 @@ class PySourceHandler:
 
     """
     __norm_python_versions: List[str]
+    __cache_dir: Union[Path, None]
+
+    __RELEASES_URL: str = "https://www.python.org/api/v2/downloads/release/?is_published=true"
+    __RELEASES_CACHE_FILE: str = ".python_versions.json"
+    __RELEASES_CACHE_TTL: int = 24 * 60 * 60  # seconds
 
-    __REGEX_PY3_VERSION: str = r"[3](\.[0-9]+){0,2}"
+    __REGEX_PY3_VERSION: Pattern = regex.compile(r"[3](\.[0-9]+){0,2}")
+    __REGEX_RELEASE_NAME: Pattern = regex.compile(r"Python (?P<version>" + __REGEX_PY3_VERSION.pattern + r")")
+    __REGEX_EXEC_VERSION: Pattern = regex.compile(r"(?<=Python )3(\.\d+){,2}")
+
+    def __init__(self, cache_dir: Path = None):
+        """Create a Python3 source handler.
+
+        Args:
+            cache_dir (Path): the path to an existing folder in which to store the list of the known Python3 versions,
+             so that it is not requested again for the next 24 hours. By default the list is not stored.
 
-    def __init__(self):
+        """
+        # The known versions are retrieved only when first needed, since it may require a request to 'python.org'
         self.__norm_python_versions = list()
-        self.get_norm_python_versions()
+        self.__cache_dir = cache_dir.resolve().absolute() if cache_dir else None
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def is_valid_py_version(version: str) -> bool:
         """Checks if the specified version respects the format of a Python3 version, i.e. `3.x.y`, where `x` and `y` are
         optional version numbers.
@@ -559,9 +820,10 @@ class PySourceHandler:
             bool: `True` for a potentially valid Python3 version string (respecting the format), `False` otherwise.
 
         """
-        return bool(regex.match(PySourceHandler.__REGEX_PY3_VERSION, version))
+        return bool(PySourceHandler.__REGEX_PY3_VERSION.fullmatch(version))
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def normalize_python_version(version: str) -> str:
         """Converts any string representing a properly formatted Python3 version to the normalized full format '3.x.y'.
 
@@ -576,8 +838,9 @@ class PySourceHandler:
 
         """
         if PySourceHandler.is_valid_py_version(version):
-            version_nums_list = version.split(".")
-            return ".".join(version_nums_list + ["0"] * (3 - len(version_nums_list)))
+            major, _, minor_micro = version.partition(".")
+            minor, _, micro = minor_micro.partition(".")
+            return f"{major}.{minor or 0}.{micro or 0}"
         else:
             raise ValueError("Invalid Python3 version format.")
 
@@ -596,41 +859,42 @@ class PySourceHandler:
             DownloadError: unable to download source.
 
         """
-        python_version = self.normalize_python_version(python_version)
         download_dir = download_dir.resolve().absolute()
 
         if not self.is_valid_py_version(python_version):
             raise ValueError(f"Specified version '{python_version}' has an invalid format.")
         python_version = self.normalize_python_version(python_version)
-        if python_version not in self.__norm_python_versions:
+
+        # Skip the download, and any request, if the same source has been already downloaded in the folder
+        source_path = download_dir.joinpath(f"python-source-{python_version}")
+        if source_path.is_dir():
+            LOGGER.info(f"Reusing Python {python_version} sources already downloaded in '{source_path}'.")
+            return source_path
+
+        if python_version not in self.get_norm_python_versions():
             raise ValueError(f"Specified Python version '{python_version}' is unknown.")
 
-        # Request the source archive
+        # Download the source archive, extracting only the 'Lib' folder with the standard library packages while
+        #  receiving it, in a temporary folder of its own
+        # NOTE the archive is streamed but its digest is not checked, since no SHA-256 is known for this URL
         download_url = f"https://www.python.org/ftp/python/{python_version}/Python-{python_version}.tgz"
-        response = requests.get(download_url)
-        if not response.status_code == 200:
-            raise DownloadError(f"Unable to find the specified Python version '{python_version}', something went"
-                                f" wrong.")
-
-        # Store the requested archive
-        archive_path = download_dir.joinpath(f"python-{python_version}.tgz")
-        with open(archive_path, "wb") as f:
-            f.write(response.content)
-
-        # Extract and delete the archive
-        shutil.unpack_archive(archive_path, download_dir)
-        archive_path.unlink()
-
-        # Store only the 'Lib' folder with the standard library packages
-        extracted_path = download_dir.joinpath(f"Python-{python_version}")
-        assert extracted_path.exists(), \
-            f"Wrong assumption on Python3 source naming, '{extracted_path}' does not exist."  # TODO change with raise
-        stdlib_path = extracted_path.joinpath("Lib")
-        assert stdlib_path.exists(), \
-            f"Wrong assumption on Python3 standard library location, '{stdlib_path}' does not exist."  # TODO change with raise
-        source_path = download_dir.joinpath(f"python-source-{python_version}")
-        stdlib_path.rename(source_path)
-        shutil.rmtree(extracted_path)
+        extract_dir = Path(tempfile.mkdtemp(dir=download_dir))
+        try:
+            try:
+                download_and_extract_tar(download_url, extract_dir, member_prefix=f"Python-{python_version}/Lib/")
+            except DownloadError as e:
+                raise DownloadError(f"Unable to find the specified Python version '{python_version}', something went"
+                                    f" wrong.") from e
+
+            # Store the 'Lib' folder on its own
+            stdlib_path = extract_dir.joinpath(f"Python-{python_version}", "Lib")
+            if not stdlib_path.is_dir():
+                raise DownloadError(f"Unexpected Python {python_version} source archive content, no standard library"
+                                    f" found in 'Python-{python_version}/Lib'.")
+            shutil.move(stdlib_path, source_path)
+        finally:
+            # Whatever the failure, never leave partially extracted content in the download folder
+            shutil.rmtree(extract_dir, ignore_errors=True)
 
         return source_path
 
@@ -641,21 +905,89 @@ class PySourceHandler:
             List[str]: the list of known Python3 versions available to download.
         """
         if not self.__norm_python_versions:
-            releases_url = "https://www.python.org/downloads/"
-            regex_html_release = r'<a href="/downloads/release/python-[0-9]+/">Python (' \
-                                 r'[3](\.[0-9]+){0,2}' \
-                                 r')</a>'
-            response = requests.get(releases_url)
-            releases_html = str(response.content)
-            self.__norm_python_versions = list()
-            for release_match in regex.finditer(regex_html_release, releases_html):
-                released_version = regex.search(self.__REGEX_PY3_VERSION + r'(?=<)',
-                                                release_match.group(0)).group(0)
-                assert released_version == self.normalize_python_version(released_version), \
-                    f"Wrong assumption, '{released_version}' is not normalized"  # TODO change with raise
-                self.__norm_python_versions.append(released_version)
+            released_versions = self.__read_cached_python_versions()
+            if released_versions is None:
+                released_versions = list(PySourceHandler.__fetch_python_versions())
+                self.__write_cached_python_versions(released_versions)
+            self.__norm_python_versions = released_versions
         return self.__norm_python_versions
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def __fetch_python_versions() -> Tuple[str, ...]:
+        """Requests the published Python3 final releases to the 'python.org' downloads API.
+
+        Returns:
+            Tuple[str, ...]: the normalized versions of the released Python3 distributions.
+
+        Raises:
+            DownloadError: unable to retrieve the Python3 releases.
+
+        """
+        import requests
+
+        try:
+            response = get_http_session().get(PySourceHandler.__RELEASES_URL, timeout=30)
+            if not response.status_code == 200:
+                raise DownloadError(f"Unable to retrieve the available Python3 versions from"
+                                    f" '{PySourceHandler.__RELEASES_URL}'.")
+            releases = response.json()
+        except requests.RequestException as e:
+            raise DownloadError(f"Unable to retrieve the available Python3 versions from"
+                                f" '{PySourceHandler.__RELEASES_URL}': {e}.") from e
+        released_versions = list()
+        for release in releases:
+            # Alpha, beta and release candidate versions are named like '3.x.y<pre>', so they would not match anyway
+            release_match = PySourceHandler.__REGEX_RELEASE_NAME.fullmatch(release.get("name", ""))
+            if release_match and not release.get("pre_release", False):
+                released_version = release_match.group("version")
+                assert released_version == PySourceHandler.normalize_python_version(released_version), \
+                    f"Wrong assumption, '{released_version}' is not normalized"  # TODO change with raise
+                released_versions.append(released_version)
+        return tuple(released_versions)
+
+    def __read_cached_python_versions(self) -> Union[List[str], None]:
+        """Reads the list of known Python3 versions stored in the cache folder, if not expired.
+
+        Returns:
+            Union[List[str], None]: the stored list of versions, or `None` if unavailable, expired or unreadable.
+
+        """
+        if self.__cache_dir:
+            cache_path = self.__cache_dir.joinpath(PySourceHandler.__RELEASES_CACHE_FILE)
+            # A corrupted or vanished cache file is never fatal, the versions are just requested again
+            try:
+                if time.time() - cache_path.stat().st_mtime < PySourceHandler.__RELEASES_CACHE_TTL:
+                    with open(cache_path, "r", encoding="utf8") as f:
+                        released_versions = json.load(f)
+                    if isinstance(released_versions, list) and \
+                            all(isinstance(version, str) for version in released_versions):
+                        return released_versions
+                    LOGGER.debug(f"Ignoring invalid cache of Python3 versions in '{cache_path}'.")
+            except (OSError, ValueError) as e:
+                LOGGER.debug(f"Ignoring unreadable cache of Python3 versions in '{cache_path}': {e}.")
+        return None
+
+    def __write_cached_python_versions(self, released_versions: List[str]):
+        """Stores the list of known Python3 versions in the cache folder, if any.
+
+        Args:
+            released_versions (List[str]): the list of versions to store.
+
+        """
+        if self.__cache_dir and self.__cache_dir.is_dir():
+            cache_path = self.__cache_dir.joinpath(PySourceHandler.__RELEASES_CACHE_FILE)
+            # Write a temporary file and then replace the cache one, so that readers (even of other runs sharing the
+            #  folder) never see a partially written file
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=self.__cache_dir, prefix=cache_path.name, suffix=".tmp")
+            try:
+                with open(file_descriptor, "w", encoding="utf8") as f:
+                    json.dump(released_versions, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
     @staticmethod
     def get_py_executable_version(py3_exec: Path) -> str:
         """Get the Python3 version from a Python3 executable file.
@@ -677,13 +1009,244 @@ class PySourceHandler:
         process = subprocess.Popen(
             command_list,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
         out, _ = process.communicate()
         if process.returncode != 0:
             raise PipError(f"Unable to read Python3 version from '{py3_exec}' executable.")
 
-        return regex.search(r"(?<=Python )3(\.\d+){,2}", str(out)).group()
+        return PySourceHandler.__REGEX_EXEC_VERSION.search(str(out)).group()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_version(version: str) -> Union[Version, None]:
+    """Parses a project version string, so that it can be compared with other versions.
+
+    Args:
+        version (str): a version string, such as the ones of the PyPI project releases.
+
+    Returns:
+        Union[Version, None]: the parsed version, `None` if the version does not comply with PEP 440.
+
+    Notes:
+        Results are memoized, since the same release versions are parsed over and over when sorting and matching them.
+
+    """
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Gets the HTTP session shared by all the requests to PyPI and python.org.
+
+    Returns:
+        requests.Session: a session keeping a pool of open connections, so that consecutive requests to the same host
+         reuse them instead of repeating the TCP and TLS handshakes. Failed connections and server errors are retried a
+         few times before giving up. The requests identify the tool in their user agent.
+
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    session = requests.Session()
+    session.headers.update({"User-Agent": f"codeontology {requests.utils.default_user_agent()}"})
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+
+class HashingReader:
+    """A wrapper of a readable binary stream, computing the SHA-256 digest of the data while it is read.
+
+    Attributes:
+        stream: the wrapped readable binary stream.
+        hash: the SHA-256 hash object updated with the data read so far.
+
+    """
+
+    def __init__(self, stream):
+        """Wraps a readable binary stream.
+
+        Args:
+            stream: a readable binary stream, such as an open file or the raw content of an HTTP response.
+
+        """
+        import hashlib
+
+        self.stream = stream
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.hash.update(data)
+        return data
+
+    def check_digest(self, url: str, sha256: Union[str, None]):
+        """Reads the remaining data of the stream, then compares its digest with the expected one.
+
+        Args:
+            url (str): the URL the data was downloaded from, for reporting.
+            sha256 (Union[str, None]): the expected hexadecimal SHA-256 digest, `None` to skip the check.
+
+        Raises:
+            DownloadError: the digest of the downloaded data does not match the expected one.
+
+        """
+        if sha256 is None:
+            return
+        while self.read(COPY_BUFFER_SIZE):
+            pass
+        if self.hash.hexdigest() != sha256.lower():
+            raise DownloadError(f"Corrupted download from '{url}', its SHA-256 digest does not match the expected one.")
+
+
+def download_file(url: str, file_path: Path, sha256: str = None):
+    """Downloads a file, streaming the response to the disk so that the whole content is never held in memory.
+
+    Args:
+        url (str): the URL of the file to download.
+        file_path (Path): the path of the file in which to store the downloaded content.
+        sha256 (str): the expected hexadecimal SHA-256 digest of the file, checked while downloading if specified.
+
+    Raises:
+        DownloadError: unable to download the file; the downloaded file does not match the expected digest.
+
+    """
+    import requests
+    import urllib3
+
+    try:
+        with get_http_session().get(url, stream=True, timeout=30) as response:
+            if not response.status_code == 200:
+                raise DownloadError(f"Unable to download '{url}', got status code {response.status_code}.")
+            # Let 'urllib3' undo any transfer encoding, since we are reading the raw stream
+            response.raw.decode_content = True
+            reader = HashingReader(response.raw)
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(reader, f, length=COPY_BUFFER_SIZE)
+            reader.check_digest(url, sha256)
+    # Errors while reading the raw stream come straight from 'urllib3', not wrapped by 'requests'
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        raise DownloadError(f"Unable to download '{url}': {e}.") from e
+
+
+def download_and_extract_tar(url: str, extract_dir: Path, member_prefix: str = "", sha256: str = None):
+    """Downloads a tar archive (possibly compressed) and extracts its content while receiving it, without ever storing
+     the archive itself.
+
+    Args:
+        url (str): the URL of the tar archive to download.
+        extract_dir (Path): the path to the folder in which to extract the archive content.
+        member_prefix (str): if specified, only the members whose name starts with this prefix are extracted.
+        sha256 (str): the expected hexadecimal SHA-256 digest of the archive, checked while downloading if specified.
+         The extracted content should be discarded if the check fails.
+
+    Raises:
+        DownloadError: unable to download the archive; the downloaded archive does not match the expected digest; the
+         downloaded data is not a valid tar archive.
+
+    """
+    import requests
+    import tarfile
+    import urllib3
+
+    try:
+        with get_http_session().get(url, stream=True, timeout=30) as response:
+            if not response.status_code == 200:
+                raise DownloadError(f"Unable to download '{url}', got status code {response.status_code}.")
+            # Let 'urllib3' undo any transfer encoding, since we are reading the raw stream
+            response.raw.decode_content = True
+            reader = HashingReader(response.raw)
+            with tarfile.open(fileobj=reader, mode="r|*", bufsize=COPY_BUFFER_SIZE,
+                              copybufsize=COPY_BUFFER_SIZE) as archive:
+                extract_tar_members(archive, extract_dir, member_prefix)
+            # The end of the archive may not have been read, such as its final padding blocks
+            reader.check_digest(url, sha256)
+    # Errors while reading the raw stream come straight from 'urllib3', not wrapped by 'requests'
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        raise DownloadError(f"Unable to download '{url}': {e}.") from e
+    except tarfile.TarError as e:
+        raise DownloadError(f"Invalid tar archive downloaded from '{url}': {e}.") from e
+
+
+def extract_tar_members(archive: tarfile.TarFile, extract_dir: Path, member_prefix: str = ""):
+    """Extracts the content of an opened tar archive in a folder, going through its members in a single pass.
+
+    Args:
+        archive (tarfile.TarFile): the tar archive, opened for reading (even as a stream).
+        extract_dir (Path): the path to the folder in which to extract the archive content.
+        member_prefix (str): if specified, only the members whose name starts with this prefix are extracted.
+
+    Raises:
+        tarfile.TarError: a member would be extracted outside the folder, such as for absolute paths, '..' paths or
+         links pointing outside it.
+
+    Notes:
+        Archives come from the network, so the 'data' extraction filter is used where available (Python 3.11.4+),
+         otherwise the members escaping the folder are rejected before being extracted.
+
+    """
+    import tarfile
+
+    # NOTE `tarfile.data_filter` is missing in the versions without extraction filters
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    members = (member for member in archive if member.name.startswith(member_prefix)) if member_prefix else archive
+    for member in members:
+        if not extract_kwargs:
+            check_tar_member(member, extract_dir)
+        archive.extract(member, extract_dir, **extract_kwargs)
+
+
+def check_tar_member(member: tarfile.TarInfo, extract_dir: Path):
+    """Checks that a tar archive member, and the target of a link member, would be extracted inside a folder.
+
+    Args:
+        member (tarfile.TarInfo): the tar archive member.
+        extract_dir (Path): the path to the folder in which to extract the archive content.
+
+    Raises:
+        tarfile.TarError: the member, or the target of the link member, would be outside the folder.
+
+    """
+    import tarfile
+
+    extract_dir_str = os.path.realpath(extract_dir)
+    member_path = os.path.realpath(os.path.join(extract_dir_str, member.name))
+    checked_paths = [member_path]
+    if member.issym():
+        checked_paths.append(os.path.realpath(os.path.join(os.path.dirname(member_path), member.linkname)))
+    elif member.islnk():
+        checked_paths.append(os.path.realpath(os.path.join(extract_dir_str, member.linkname)))
+    for checked_path in checked_paths:
+        if os.path.commonpath([extract_dir_str, checked_path]) != extract_dir_str:
+            raise tarfile.TarError(f"Tar archive member '{member.name}' would be extracted outside '{extract_dir}'.")
+
+
+def extract_archive(archive_path: Path, extract_dir: Path, member_prefix: str = ""):
+    """Extracts the content of an archive in a folder.
+
+    Tar archives (possibly compressed) are read sequentially in a single pass, without the random access to their
+     members performed by `shutil.unpack_archive`, which is still used for any other format (e.g. zip archives).
+
+    Args:
+        archive_path (Path): the path to the archive file.
+        extract_dir (Path): the path to the folder in which to extract the archive content.
+        member_prefix (str): if specified, only the members whose name starts with this prefix are extracted from tar
+         archives, skipping all the others. Other formats are always extracted entirely.
+
+    """
+    import tarfile
+
+    if tarfile.is_tarfile(archive_path):
+        with tarfile.open(archive_path, mode="r|*", bufsize=COPY_BUFFER_SIZE,
+                          copybufsize=COPY_BUFFER_SIZE) as archive:
+            extract_tar_members(archive, extract_dir, member_prefix)
+    else:
+        shutil.unpack_archive(archive_path, extract_dir)
 
 
 def is_valid_package_name(package_name: str) -> bool:
@@ -696,7 +1259,7 @@ def is_valid_package_name(package_name: str) -> bool:
         bool: `True` for a valid package name, `False` otherwise.
 
     """
-    return bool(regex.match(r"^[A-Za-z_]+$", package_name))
+    return bool(REGEX_PACKAGE_NAME.fullmatch(package_name))
 
 
 class PipError(Exception):
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Dict, List, Set, Tuple, Union
+from typing import Callable, Dict, List, Set, Tuple, Union
 from threading import Thread
 
 import astroid
@@ -41,7 +40,7 @@ class Extractor:
 
     """
     project: Project = None
-    to_extract: Dict = dict()
+    __extract_functions: Dict[type, Union[Callable, None]] = dict()
 
     def __init__(self, project: Project):
         Extractor.project = project
@@ -53,39 +52,60 @@ class Extractor:
 
     @staticmethod
     def extract_recursively(node: astroid.NodeNG, root_node: astroid.Module, do_link_stmts: bool):
-        # Extract from the current node
-        Extractor.extract(node, do_link_stmts=do_link_stmts)
-        # Check the node upper hierarchy, in case we are visiting an imported node of a referenced module/package,
-        #  and we may have not instantiated its package individual.
-        current_root: astroid.Module = node.root()
-        if node != current_root and root_node != current_root:
-            Extractor.extract(current_root, do_link_stmts=False)
-            root_node = current_root
-        # Check the node lower hierarchy
-        for child in node.get_children():
-            Extractor.extract_recursively(child, root_node=root_node, do_link_stmts=True)
+        # Visit the nodes in pre-order through an explicit stack, instead of recursion, along with the root node of
+        #  their visit
+        to_visit_nodes = [(node, root_node, do_link_stmts)]
+        while to_visit_nodes:
+            node, root_node, do_link_stmts = to_visit_nodes.pop()
+            # Extract from the current node
+            Extractor.extract(node, do_link_stmts=do_link_stmts)
+            # Check the node upper hierarchy, in case we are visiting an imported node of a referenced module/package,
+            #  and we may have not instantiated its package individual.
+            current_root: astroid.Module = node.root()
+            if node != current_root and root_node != current_root:
+                Extractor.extract(current_root, do_link_stmts=False)
+                root_node = current_root
+            # Check the node lower hierarchy. Reversed, so that the first child is the next one to be popped
+            to_visit_nodes.extend(reversed([(child, root_node, True) for child in node.get_children()]))
 
     @staticmethod
     def extract(node: astroid.NodeNG, do_link_stmts: bool):
-        def get_extract_fun_name(_node: astroid.NodeNG) -> str:
-            _type_name = type(_node).__name__
-            return "extract_" + \
-                _type_name[0].lower() + "".join([ch if ch.islower() else "_" + ch.lower() for ch in _type_name[1:]])
-
-        if Extractor.to_extract.get(id(node), None) is None:
-            Extractor.to_extract[id(node)] = [True, True]
-        to_extract_list = Extractor.to_extract.get(id(node))
+        # The pending extractions (without and with statements linking) are stored on the node itself
+        try:
+            to_extract_list = node.to_extract_
+        except AttributeError:
+            to_extract_list = node.to_extract_ = [True, True]
         if to_extract_list[int(do_link_stmts)]:
             parent_block_node = get_parent_block_node(node)
             if parent_block_node is not None:
                 Extractor.extract(parent_block_node, do_link_stmts=do_link_stmts)
-            extract_function_name = get_extract_fun_name(node)
-            extract_function = getattr(Extractor, extract_function_name, None)
+            extract_function = Extractor.__get_extract_function(type(node))
             if extract_function is not None:
                 to_extract_list[int(do_link_stmts)] = False
                 extract_function(node, do_link_stmts=do_link_stmts)
-            else:
-                LOGGER.debug(f"No extraction function available for nodes of type {type(node).__name__}")
+
+    @staticmethod
+    def __get_extract_function(node_type: type) -> Union[Callable, None]:
+        """Gets the extract function for a type of node, resolving its name only the first time the type is met.
+
+        Args:
+            node_type (type): the type of an AST node.
+
+        Returns:
+            Union[Callable, None]: the extract function for the nodes of that type, `None` if there is not any.
+
+        """
+        try:
+            return Extractor.__extract_functions[node_type]
+        except KeyError:
+            type_name = node_type.__name__
+            extract_function_name = "extract_" + \
+                type_name[0].lower() + "".join([ch if ch.islower() else "_" + ch.lower() for ch in type_name[1:]])
+            extract_function = getattr(Extractor, extract_function_name, None)
+            if extract_function is None:
+                LOGGER.debug(f"No extraction function available for nodes of type {type_name}")
+            Extractor.__extract_functions[node_type] = extract_function
+            return extract_function
 
     @staticmethod
     def _link_statements(node: astroid.NodeNG, stmt_attr: str = "stmt_individual"):
@@ -96,7 +116,8 @@ class Extractor:
     @staticmethod
     def _link_statements_backward(node: astroid.NodeNG, stmt_attr: str):
         assert hasattr(node, stmt_attr)
-        if getattr(getattr(node, stmt_attr), "hasPreviousStatement", None) is None:
+        stmt_individual = getattr(node, stmt_attr)
+        if getattr(stmt_individual, "hasPreviousStatement", None) is None:
             prev_node = get_prev_statement(node)
             if prev_node is not None:
                 assert prev_node.is_statement
@@ -104,23 +125,24 @@ class Extractor:
                 prev_stmt_individual, prev_stmt_attr = get_stmt_info(prev_node)
 
                 if prev_stmt_individual is not None:
-                    getattr(node, stmt_attr).hasPreviousStatement = prev_stmt_individual
-                    assert getattr(node, stmt_attr) is prev_stmt_individual.hasNextStatement
+                    stmt_individual.hasPreviousStatement = prev_stmt_individual
+                    assert stmt_individual is prev_stmt_individual.hasNextStatement
                     Extractor._link_statements_backward(prev_node, prev_stmt_attr)
 
                 if prev_stmt_individual is not None and prev_stmt_individual.hasStatementPosition is not None:
-                    getattr(node, stmt_attr).hasStatementPosition = prev_stmt_individual.hasStatementPosition + 1
+                    stmt_individual.hasStatementPosition = prev_stmt_individual.hasStatementPosition + 1
                 else:
-                    getattr(node, stmt_attr).hasStatementPosition = get_statement_position(node)
+                    stmt_individual.hasStatementPosition = get_statement_position(node)
 
             else:
-                for node_stmt_individual in [getattr(node, stmt_attr)] + getattr(node, stmt_attr).get_equivalent_to():
+                for node_stmt_individual in [stmt_individual] + stmt_individual.get_equivalent_to():
                     node_stmt_individual.hasStatementPosition = OntologyIndividuals.START_POSITION_COUNT
 
     @staticmethod
     def _link_statements_forward(node: astroid.NodeNG, stmt_attr: str):
         assert hasattr(node, stmt_attr)
-        if getattr(getattr(node, stmt_attr), "hasNextStatement", None) is None:
+        stmt_individual = getattr(node, stmt_attr)
+        if getattr(stmt_individual, "hasNextStatement", None) is None:
             next_node = get_next_statement(node)
 
             if next_node is not None:
@@ -129,14 +151,14 @@ class Extractor:
                 next_stmt_individual, next_stmt_attr = get_stmt_info(next_node)
 
                 if next_stmt_individual is not None:
-                    next_stmt_individual.hasPreviousStatement = getattr(node, stmt_attr)
-                    assert next_stmt_individual is getattr(node, stmt_attr).hasNextStatement
+                    next_stmt_individual.hasPreviousStatement = stmt_individual
+                    assert next_stmt_individual is stmt_individual.hasNextStatement
                     Extractor._link_statements_forward(next_node, next_stmt_attr)
 
                 if next_stmt_individual is not None and next_stmt_individual.hasStatementPosition is not None:
-                    getattr(node, stmt_attr).hasStatementPosition = next_stmt_individual.hasStatementPosition - 1
+                    stmt_individual.hasStatementPosition = next_stmt_individual.hasStatementPosition - 1
                 else:
-                    getattr(node, stmt_attr).hasStatementPosition = get_statement_position(node)
+                    stmt_individual.hasStatementPosition = get_statement_position(node)
 
     # TODO Add a general comment about the following methods, so you don't put doc inside every method
 
@@ -153,9 +175,10 @@ class Extractor:
             #  this is useful also for other modules and not only `os.path`.
             for p in Extractor.project.original_sys_path:
                 if str(p) in node.file:
-                    converted_p = Path(node.file.replace(str(p), str(Extractor.project.python3_path)))
-                    if converted_p in Extractor.project.packages:
-                        node.package_ = Extractor.project.packages[converted_p]
+                    converted_package = Extractor.project.find_package(
+                        node.file.replace(str(p), str(Extractor.project.python3_path)))
+                    if converted_package:
+                        node.package_ = converted_package
                         break
         OntologyIndividuals.init_block_statement(node)
         if hasattr(node, "package_"):
@@ -219,15 +242,22 @@ class Extractor:
     @staticmethod
     def extract_class_def(class_node: astroid.ClassDef, do_link_stmts: bool):
         def get_class_full_name(_class_node: astroid.ClassDef, _module: astroid.Module) -> str:
-            scope_hierarchy_names = []
-            scope = _class_node.scope()
-            while not type(scope) is astroid.Module:
-                if type(scope) is astroid.ClassDef:
-                    scope_hierarchy_names.insert(0, scope.name)
-                else:
-                    return ""
-                scope = scope.parent.scope()
-            return f"{_module.package_.full_name}.{'.'.join(scope_hierarchy_names)}"
+            # The name is cached on the node, so that nested classes can build on the name of their enclosing class
+            #  instead of walking up the whole scope hierarchy each time
+            try:
+                return _class_node.full_name_
+            except AttributeError:
+                pass
+            parent_scope = _class_node.parent.scope()
+            if type(parent_scope) is astroid.Module:
+                full_name = f"{_module.package_.full_name}.{_class_node.name}"
+            elif type(parent_scope) is astroid.ClassDef:
+                parent_full_name = get_class_full_name(parent_scope, _module)
+                full_name = f"{parent_full_name}.{_class_node.name}" if parent_full_name else ""
+            else:
+                full_name = ""
+            _class_node.full_name_ = full_name
+            return full_name
 
         assert class_node.is_statement
 
@@ -253,8 +283,7 @@ class Extractor:
                 class_node.individual.hasFullyQualifiedName = class_full_name
 
         if hasattr(class_node, "fields"):
-            for field_name in getattr(class_node, "fields"):
-                field_type, field_description, field_declaration_node = class_node.fields[field_name]
+            for field_name, (field_type, field_description, field_declaration_node) in class_node.fields.items():
                 # TODO USE field_description
                 assert type(field_declaration_node) in [astroid.AssignName, astroid.AssignAttr]
 
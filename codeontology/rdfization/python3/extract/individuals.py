@@ -257,19 +257,16 @@ class OntologyIndividuals:
             if type(true_stmt_node) is not astroid.Module:
                 assert true_stmt_node.is_statement
 
-            if not type(true_stmt_node) is astroid.Module:
-                assert true_stmt_node.is_statement
-
-            setattr(stmt_node, stmt_attr, stmt_type())
-            assert isinstance(getattr(stmt_node, stmt_attr), stmt_type)
-            getattr(stmt_node, stmt_attr).hasSourceCode = true_stmt_node.as_string()
+            stmt_individual = stmt_type()
+            setattr(stmt_node, stmt_attr, stmt_individual)
+            stmt_individual.hasSourceCode = true_stmt_node.as_string()
             if true_stmt_node.lineno:
-                getattr(stmt_node, stmt_attr).hasLine = true_stmt_node.lineno + OntologyIndividuals.START_LINE_COUNT - 1
+                stmt_individual.hasLine = true_stmt_node.lineno + OntologyIndividuals.START_LINE_COUNT - 1
             if true_stmt_node is not stmt_node:
                 if not hasattr(true_stmt_node, "stmt_individual"):
                     OntologyIndividuals.init_statement(true_stmt_node)
-                true_stmt_node.stmt_individual.set_equivalent_to([getattr(stmt_node, stmt_attr)])
-                assert true_stmt_node.stmt_individual not in getattr(stmt_node, stmt_attr).get_equivalent_to()
+                true_stmt_node.stmt_individual.set_equivalent_to([stmt_individual])
+                assert true_stmt_node.stmt_individual not in stmt_individual.get_equivalent_to()
 
             if not type(true_stmt_node) is astroid.Module:
                 parent_block_stmt_individual = get_parent_block_individual(true_stmt_node)
@@ -284,16 +281,18 @@ class OntologyIndividuals:
 
     @staticmethod
     def init_block_statement(node: astroid.NodeNG, stmt_attr: str = "stmt_block_individual"):
-        if type(node) is astroid.If:
-            assert stmt_attr in ["stmt_block_then_individual", "stmt_block_else_individual"]
-        elif type(node) is astroid.TryFinally:
-            assert stmt_attr in ["stmt_block_try_individual", "stmt_block_finally_individual"]
-        elif type(node) is astroid.TryExcept:
-            assert stmt_attr in ["stmt_block_try_individual"]
-        elif type(node) is astroid.ExceptHandler:
-            assert stmt_attr in ["stmt_block_except_individual"]
-        else:
-            assert stmt_attr in ["stmt_block_individual"]
+        if __debug__:
+            # Only the assertions depend on the type checks, so they are skipped altogether when optimizing
+            if type(node) is astroid.If:
+                assert stmt_attr in ["stmt_block_then_individual", "stmt_block_else_individual"]
+            elif type(node) is astroid.TryFinally:
+                assert stmt_attr in ["stmt_block_try_individual", "stmt_block_finally_individual"]
+            elif type(node) is astroid.TryExcept:
+                assert stmt_attr in ["stmt_block_try_individual"]
+            elif type(node) is astroid.ExceptHandler:
+                assert stmt_attr in ["stmt_block_except_individual"]
+            else:
+                assert stmt_attr in ["stmt_block_individual"]
         if not hasattr(node, stmt_attr):
             OntologyIndividuals.init_statement(node, stmt_type=ontology.BlockStatement, stmt_attr=stmt_attr)
             stmt_individual = getattr(node, stmt_attr)
@@ -1,6 +1,9 @@
 """Python parsing functionalities."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+import io
 from pathlib import Path
+import tokenize
 from typing import Dict, List, Set, Tuple, Type, Union
 from threading import Thread
 
@@ -28,7 +31,10 @@ class Parser:
 
     project: Project
     parsed_packages: Dict[Path, Package]  # TODO rename
-    __failed_imports: Set[str]
+    __failed_imports: Set[Tuple[str, Union[int, None]]]
+    __source_reads: Dict[Path, Future]
+
+    __MAX_READ_WORKERS = 8
 
     def __init__(self, project: Project):
         """Creates a `Parser` instance, parsing all the source files of the project's own libraries and packages, as
@@ -42,10 +48,17 @@ class Parser:
         self.project = project
         self.parsed_packages = dict()
         self.__failed_imports = set()
-        for package in tqdm(list(project.get_packages())):
-            t = Thread(target=self.__parse_package_recursively, args=[package, self.parsed_packages])
-            t.start()
-            t.join()
+        packages = list(project.get_packages())
+        # Parsing has to happen one package at a time, since `astroid` caches are shared and order dependant, but the
+        #  project source files can be read in the meantime
+        with ThreadPoolExecutor(max_workers=Parser.__MAX_READ_WORKERS) as executor:
+            self.__source_reads = {package.source: executor.submit(Parser.__read_source, package.source)
+                                   for package in packages if package.source}
+            for package in tqdm(packages):
+                t = Thread(target=self.__parse_package_recursively, args=[package, self.parsed_packages])
+                t.start()
+                t.join()
+            self.__source_reads = dict()
 
     def __parse_package_recursively(self, package: Package, parsed_packages: Dict[Path, Package]):
         """Accesses and parses the source code related to a `package, storing the AST in the `Package` object itself
@@ -61,18 +74,17 @@ class Parser:
 
         """
         # Only `REGULAR` and `MODULE` packages have related source code.
-        if package.type in [Package.Type.REGULAR, package.Type.MODULE]:
+        if package.type is Package.Type.REGULAR or package.type is Package.Type.MODULE:
+            if parsed_packages.get(package.source, None):
+                # Already parsed (e.g. when reached through an import), along with the packages it imports
+                return
             cached_ast = astroid.astroid_manager.MANAGER.astroid_cache.get(package.full_name, None)
             if not cached_ast:
                 # Fails may happen during the decoding or parsing of some Python source files. All the witnessed fails
                 #  seems to come from 'test' packages anyway.
                 ast = None
-                try:
-                    with package.source.open("rb") as stream:
-                        source_text = stream.read().decode()
-                except UnicodeError as e:
-                    LOGGER.warning(f"Failed decoding '{package.source}' with error '{e}'.")
-                    source_text = None
+                source_read = self.__source_reads.pop(package.source, None)
+                source_text = source_read.result() if source_read else Parser.__read_source(package.source)
                 if source_text is not None:
                     try:
                         ast = astroid.parse(source_text, path=str(package.source), module_name=package.full_name)
@@ -88,6 +100,29 @@ class Parser:
             else:
                 LOGGER.warning(f"No AST found for parsed package '{package.source}'.")
 
+    @staticmethod
+    def __read_source(source_path: Path) -> Union[str, None]:
+        """Reads the source code of a package.
+
+        Args:
+            source_path (Path): the path to the source file of the package.
+
+        Returns:
+            Union[str, None]: the source code, or `None` if it cannot be decoded.
+
+        Notes:
+            The file is read in a single call and decoded once, with the encoding declared by its coding cookie or
+             BOM (UTF-8 by default), as the interpreter would do.
+
+        """
+        source_bytes = source_path.read_bytes()
+        try:
+            encoding, _ = tokenize.detect_encoding(io.BytesIO(source_bytes).readline)
+            return source_bytes.decode(encoding)
+        except (SyntaxError, UnicodeError) as e:
+            LOGGER.warning(f"Failed decoding '{source_path}' with error '{e}'.")
+            return None
+
     def __parse_imports_recursively(self, node: astroid.NodeNG, parsed_packages: Dict[Path, Package]):
         """Goes through the remaining nodes of an AST to search for the actually imported `Package`s, looking at the
          'import statements': identified imported packages are then recursively parsed too.
@@ -97,30 +132,48 @@ class Parser:
             parsed_packages (Dict[Path, Package]): the parsed packages so far.
 
         """
-        for child in node.get_children():
-            to_import_names = []
-            if type(child) is astroid.Import:
-                for mod_name, mod_alias in child.names:
-                    to_import_names.append(mod_name)
-            if type(child) is astroid.ImportFrom:
-                to_import_names.append(child.modname)
+        # Only the import statements are of interest, so let `astroid` yield just them (in the same order of a visit of
+        #  the AST) instead of visiting all the nodes of the AST
+        # The same module may be imported many times in the same AST (e.g. in different functions), but it is enough to
+        #  resolve it once. Absolute imports do not depend on the importing module either, so those that already failed
+        #  are not attempted again.
+        resolved_imports = set()
+        astroid_cache = astroid.astroid_manager.MANAGER.astroid_cache
+        for import_node in node.nodes_of_class((astroid.Import, astroid.ImportFrom)):
+            if type(import_node) is astroid.Import:
+                to_import_names = [mod_name for mod_name, mod_alias in import_node.names]
+                import_level = None
+            else:
+                to_import_names = [import_node.modname]
+                import_level = import_node.level
             for name in to_import_names:
+                import_key = (name, import_level)
+                if import_key in resolved_imports or (not import_level and import_key in self.__failed_imports):
+                    continue
+                resolved_imports.add(import_key)
                 try:
-                    ast = child.do_import_module(name)
+                    # Absolute imports of already parsed modules are taken straight from the cache, skipping the import
+                    #  resolution machinery of `astroid`
+                    ast = astroid_cache.get(name, None) if not import_level else None
+                    if ast is None:
+                        ast = import_node.do_import_module(name)
                     assert ast
+                    if hasattr(ast, "package_"):
+                        # Already linked to its package while parsed, no need to look for the package from the file
+                        continue
                     if not ast.file:
                         self.__reconstruct_stdlib_module_from_ast(ast)
-                    ast_path = Path(ast.file)
-                    package = self.project.find_package(ast_path)
-                    if package and not parsed_packages.get(ast_path, None):
-                        self.__parse_package_recursively(package, parsed_packages)
+                    package = self.project.find_package(ast.file)
                 except (astroid.AstroidError, AttributeError):
                     # Many modules may have failing imports, and the error is usually properly handled at runtime. It
                     #  is ok, especially if we are sure we are parsing an actually working project.
-                    if name not in self.__failed_imports:
+                    if import_key not in self.__failed_imports:
                         LOGGER.debug(f"Impossible to load AST for module '{name}'.")
-                        self.__failed_imports.add(name)
-            self.__parse_imports_recursively(child, parsed_packages)
+                        self.__failed_imports.add(import_key)
+                    continue
+                # Errors while parsing the imported package are not about this import, that must not be marked as failed
+                if package and not parsed_packages.get(package.source, None):
+                    self.__parse_package_recursively(package, parsed_packages)
 
     def __reconstruct_stdlib_module_from_ast(self, ast: astroid.Module):
         """Reconstructs a standard library source file that is not present in the downloaded Python source folder, but
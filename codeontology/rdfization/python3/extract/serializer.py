@@ -80,8 +80,12 @@ class Serializer:
         # Executed after the 'with' block.
         finally:
             # Restore sys.path and astroid cache.
-            sys.path = saved_sys_path.copy()
-            astroid.astroid_manager.MANAGER.astroid_cache = saved_astroid_cache.copy()
+            sys.path = saved_sys_path
+            # Restore the cache in place: the dictionary is shared by all the managers, so it is not replaced, and the
+            #  backup is not needed anymore, so there is no need for another copy.
+            astroid_cache = astroid.astroid_manager.MANAGER.astroid_cache
+            astroid_cache.clear()
+            astroid_cache.update(saved_astroid_cache)
 
     def __build_unique_model(self):
         """Parse the Python modules of interest available in the `Project`, creating their ASTs and adding them to the
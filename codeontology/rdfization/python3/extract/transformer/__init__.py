@@ -1,6 +1,6 @@
 """Class and methods to visit the AST nodes and apply transform functions to increase their expressiveness."""
 
-from typing import Set, Union
+from typing import Callable, Dict, Set, Union
 from threading import Thread
 
 import astroid
@@ -16,6 +16,8 @@ from codeontology.utils import pass_on_exception
 
 class Transformer:
     """A collection of methods to integrate the information carried by the AST nodes of 'astroid'."""
+    __transform_functions: Dict[type, Union[Callable, None]] = dict()
+    __UNRESOLVED = object()  # marks the node types not met yet, since `None` marks those without a transform function
 
     def __init__(self, packages: Set[Package]):
         """Launches the application of the proper transformations on the AST nodes of the respective packages.
@@ -31,18 +33,43 @@ class Transformer:
 
     @staticmethod
     def visit_to_transform(node: astroid.NodeNG) -> None:
-        def get_transform_fun_name(_node: astroid.NodeNG) -> str:
-            _type_name = type(_node).__name__
-            return "_transform_" + \
-                _type_name[0].lower() + "".join([ch if ch.islower() else "_" + ch.lower() for ch in _type_name[1:]])
-
-        transform_function_name = get_transform_fun_name(node)
-        transform_function = getattr(Transformer, transform_function_name, None)
-        if transform_function:
-            transform_function(node)
-        for child in node.get_children():
-            if child:
-                Transformer.visit_to_transform(child)
+        # Visit the nodes in pre-order through an explicit stack, instead of recursion. The table of the known transform
+        #  functions is referenced locally, and only the node types not met yet need to be resolved.
+        transform_functions = Transformer.__transform_functions
+        unresolved = Transformer.__UNRESOLVED
+        to_visit_nodes = [node]
+        while to_visit_nodes:
+            node = to_visit_nodes.pop()
+            node_type = type(node)
+            # A single lookup for the known node types
+            transform_function = transform_functions.get(node_type, unresolved)
+            if transform_function is unresolved:
+                transform_function = Transformer.__get_transform_function(node_type)
+            if transform_function:
+                transform_function(node)
+            # Reversed, so that the first child is the next one to be popped
+            to_visit_nodes.extend(reversed([child for child in node.get_children() if child]))
+
+    @staticmethod
+    def __get_transform_function(node_type: type) -> Union[Callable, None]:
+        """Gets the transform function for a type of node, resolving its name only the first time the type is met.
+
+        Args:
+            node_type (type): the type of an AST node.
+
+        Returns:
+            Union[Callable, None]: the transform function for the nodes of that type, `None` if there is not any.
+
+        """
+        try:
+            return Transformer.__transform_functions[node_type]
+        except KeyError:
+            type_name = node_type.__name__
+            transform_function_name = "_transform_" + \
+                type_name[0].lower() + "".join([ch if ch.islower() else "_" + ch.lower() for ch in type_name[1:]])
+            transform_function = getattr(Transformer, transform_function_name, None)
+            Transformer.__transform_functions[node_type] = transform_function
+            return transform_function
 
     @staticmethod
     def _transform_module(module_node: astroid.Module):
@@ -74,14 +101,19 @@ class Transformer:
                     node = node.parent
                 assert type(node) is astroid.ClassDef
                 class_node = node
-                ancestors_mro = class_node.mro()[1:]  # First in MRO is the parent class itself
-                for ancestor_node in ancestors_mro:
-                    for ancestor_method_node in ancestor_node.methods():
-                        # In Python methods are identified just by their names, there is no "overloading"
-                        if ancestor_method_node.name == fun_node.name:
-                            # Set and terminate search
-                            fun_node.overrides = ancestor_method_node
-                            return
+                # The methods of the ancestors are searched once per class, and then shared by all of its methods
+                try:
+                    ancestors_methods = class_node.ancestors_methods_
+                except AttributeError:
+                    ancestors_methods = dict()
+                    ancestors_mro = class_node.mro()[1:]  # First in MRO is the parent class itself
+                    for ancestor_node in ancestors_mro:
+                        for ancestor_method_node in ancestor_node.methods():
+                            # In Python methods are identified just by their names, there is no "overloading", and
+                            #  the first one found in MRO is the one being overridden
+                            ancestors_methods.setdefault(ancestor_method_node.name, ancestor_method_node)
+                    class_node.ancestors_methods_ = ancestors_methods
+                fun_node.overrides = ancestors_methods.get(fun_node.name, None)
 
         def add_return(function_node: Union[astroid.FunctionDef, astroid.AsyncFunctionDef]):
             """TODO Adds a new `returns_type` and `returns_description` attribute"""
@@ -0,0 +1,30 @@
+"""Tests for the file system representation of projects in 'codeontology.rdfization.python3.explore'."""
+
+from codeontology.rdfization.python3.explore import Project
+
+
+def make_files(root, *rel_paths):
+    for rel_path in rel_paths:
+        path = root.joinpath(rel_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def test_stdlibs_named_like_dependencies_are_kept(tmp_path):
+    make_files(
+        tmp_path,
+        "project/setup.py",
+        "pkgs/mylib/__init__.py",
+        "deps/typing.py", "deps/json/__init__.py",
+        "stdlib/os.py", "stdlib/typing.py", "stdlib/json/__init__.py", "stdlib/json/decoder.py",
+    )
+    project = Project("project", tmp_path.joinpath("project"), tmp_path.joinpath("pkgs"), tmp_path.joinpath("deps"),
+                      tmp_path.joinpath("stdlib"))
+
+    assert sorted(library.name for library in project.stdlibs) == ["json", "os", "typing"]
+    assert sorted(library.name for library in project.dependencies) == ["json", "typing"]
+    # Both the dependency and the standard library versions of the same package are found by their own path
+    for rel_path in ["stdlib/os.py", "stdlib/typing.py", "stdlib/json/decoder.py", "deps/typing.py"]:
+        assert project.find_package(tmp_path.joinpath(rel_path)) is not None
+    assert project.find_package(tmp_path.joinpath("stdlib/json/decoder.py")).full_name == "json.decoder"
+    assert project.find_package(tmp_path.joinpath("deps/json/__init__.py")).library in project.dependencies
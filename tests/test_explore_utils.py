@@ -0,0 +1,191 @@
+"""Tests for the download and installation helpers of 'codeontology.rdfization.python3.explore.utils'."""
+
+import pytest
+
+from codeontology.rdfization.python3.explore import utils
+from codeontology.rdfization.python3.explore.utils import DownloadError, ProjectHandler, PySourceHandler
+
+
+@pytest.fixture
+def requests():
+    return pytest.importorskip("requests")
+
+
+@pytest.fixture
+def failing_session(monkeypatch, requests):
+    class FailingSession:
+        """A stand-in for the shared HTTP session, whose requests never reach the server."""
+
+        def get(self, url, **kwargs):
+            raise requests.ConnectionError(f"Unreachable '{url}'.")
+
+    monkeypatch.setattr(utils, "get_http_session", lambda: FailingSession())
+
+
+def test_network_errors_are_download_errors(failing_session, requests, tmp_path):
+    with pytest.raises(DownloadError) as exc_info:
+        ProjectHandler().get_project_versions("codeontology-unreachable-project")
+    assert isinstance(exc_info.value.__cause__, requests.ConnectionError)
+
+    with pytest.raises(DownloadError):
+        utils.download_file("https://example.org/file.txt", tmp_path.joinpath("file.txt"))
+
+    with pytest.raises(DownloadError):
+        utils.download_and_extract_tar("https://example.org/archive.tar.gz", tmp_path)
+
+
+def test_packages_from_top_level_with_subpackage(tmp_path):
+    for rel_path in ["toplib/__init__.py", "single.py", "nspkg/sub/__init__.py", "nspkg/other/__init__.py"]:
+        tmp_path.joinpath(rel_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(rel_path).touch()
+    info_dir = tmp_path.joinpath("distr-1.0.dist-info")
+    info_dir.mkdir()
+    info_dir.joinpath("top_level.txt").write_text("toplib\nsingle\nnspkg/sub\n", encoding="utf8")
+
+    assert ProjectHandler.get_packages_from_installation_dir(tmp_path) == {
+        tmp_path.joinpath("toplib"), tmp_path.joinpath("single.py"), tmp_path.joinpath("nspkg", "sub")
+    }
+
+
+@pytest.mark.parametrize("project_target", [
+    "foo @ https://example.org/foo-1.0.tar.gz",
+    "foo[extra]==1.0",
+    "foo==1.0; python_version < '3'",
+])
+def test_download_target_with_unsupported_parts(project_target, tmp_path):
+    with pytest.raises(ValueError, match="Invalid project target"):
+        ProjectHandler().download_source_from_pypi(project_target, tmp_path)
+
+
+@pytest.mark.parametrize("cache_content", ['["3.11.4", "3.1', '{"3.11.4": null}', '[3, 11]'])
+def test_invalid_python_versions_cache_is_fetched_again(cache_content, monkeypatch, tmp_path):
+    monkeypatch.setattr(PySourceHandler, "_PySourceHandler__fetch_python_versions", staticmethod(lambda: ("3.12.0",)))
+    tmp_path.joinpath(".python_versions.json").write_text(cache_content, encoding="utf8")
+
+    assert PySourceHandler(tmp_path).get_norm_python_versions() == ["3.12.0"]
+    # The cache is replaced with the fetched versions, leaving no temporary file behind
+    monkeypatch.setattr(PySourceHandler, "_PySourceHandler__fetch_python_versions", staticmethod(lambda: ()))
+    assert PySourceHandler(tmp_path).get_norm_python_versions() == ["3.12.0"]
+    assert [path.name for path in tmp_path.iterdir()] == [".python_versions.json"]
+
+
+def make_tar(tar_path, members):
+    import io
+    import tarfile
+
+    with tarfile.open(tar_path, "w:gz") as archive:
+        for name, link_name in members:
+            member = tarfile.TarInfo(name)
+            if link_name:
+                member.type, member.linkname = tarfile.SYMTYPE, link_name
+                archive.addfile(member)
+            else:
+                member.size = 1
+                archive.addfile(member, io.BytesIO(b"x"))
+
+
+@pytest.mark.parametrize("with_filters", [True, False])
+@pytest.mark.parametrize("members", [
+    [("pkg/../../escaped.py", None)],
+    [("{tmp_path}/absolute.py", None)],
+    [("pkg/link", "../../outside")],
+])
+def test_tar_members_outside_folder_are_rejected(members, with_filters, monkeypatch, tmp_path):
+    import tarfile
+
+    if not with_filters:
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    elif not hasattr(tarfile, "data_filter"):
+        pytest.skip("tar extraction filters not available")
+    make_tar(tmp_path.joinpath("archive.tar.gz"), [(name.format(tmp_path=tmp_path), link) for name, link in members])
+    extract_dir = tmp_path.joinpath("extract")
+    extract_dir.mkdir()
+
+    # The member may be rejected, or be extracted inside the folder anyway (as the 'data' filter does for absolute
+    #  paths), but nothing is ever written outside the folder
+    try:
+        utils.extract_archive(tmp_path.joinpath("archive.tar.gz"), extract_dir)
+    except tarfile.TarError:
+        pass
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["archive.tar.gz", "extract"]
+    assert not any(path.is_symlink() for path in extract_dir.rglob("*"))
+
+
+@pytest.mark.parametrize("with_filters", [True, False])
+def test_tar_members_inside_folder_are_extracted(with_filters, monkeypatch, tmp_path):
+    import tarfile
+
+    if not with_filters:
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    make_tar(tmp_path.joinpath("archive.tar.gz"), [("pkg/mod.py", None), ("pkg/link.py", "mod.py")])
+
+    utils.extract_archive(tmp_path.joinpath("archive.tar.gz"), tmp_path.joinpath("extract"))
+    assert tmp_path.joinpath("extract", "pkg", "link.py").read_bytes() == b"x"
+
+
+def test_setup_with_literal_keywords_is_not_executed(tmp_path):
+    tmp_path.joinpath("setup.py").write_text(
+        "from setuptools import setup\n"
+        "setup(name='literal', version='1.0', packages=['literal'])\n"
+        "raise SystemExit('the setup file has been executed')\n",
+        encoding="utf8"
+    )
+    assert ProjectHandler.get_config_file_content(tmp_path) == {
+        "name": "literal", "version": "1.0", "packages": ["literal"]
+    }
+
+
+def test_setup_with_computed_keywords_is_executed(tmp_path):
+    pytest.importorskip("setuptools")
+    tmp_path.joinpath("setup.py").write_text(
+        "from setuptools import setup\n"
+        "NAME = 'comp' + 'uted'\n"
+        "setup(name=NAME, version='2.0')\n",
+        encoding="utf8"
+    )
+    assert ProjectHandler.get_config_file_content(tmp_path) == {"name": "computed", "version": "2.0"}
+
+
+@pytest.mark.parametrize("pip_output, distributions", [
+    (b"Processing ./proj\r\nWould install proj-1.0\r\n", "proj-1.0"),
+    (b"Installing collected packages: dep, proj\nSuccessfully installed dep-2.0 proj-1.0\n", "dep-2.0 proj-1.0"),
+    (b"ERROR: something went wrong\n", None),
+])
+def test_pip_installed_distributions(pip_output, distributions):
+    assert ProjectHandler._ProjectHandler__get_pip_installed_distributions(pip_output) == distributions
+
+
+def test_download_with_wrong_digest(requests, monkeypatch, tmp_path):
+    import hashlib
+    import io
+
+    make_tar(tmp_path.joinpath("archive.tar.gz"), [("pkg/mod.py", None)])
+    content = tmp_path.joinpath("archive.tar.gz").read_bytes()
+
+    class StreamingResponse:
+        """A stand-in for a successful streamed response, with the content of the archive."""
+        status_code = 200
+
+        def __init__(self):
+            self.raw = io.BytesIO(content)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    class StreamingSession:
+        """A stand-in for the shared HTTP session, always answering with the archive."""
+
+        def get(self, url, **kwargs):
+            return StreamingResponse()
+
+    monkeypatch.setattr(utils, "get_http_session", lambda: StreamingSession())
+    url, wrong_sha256 = "https://example.org/archive.tar.gz", hashlib.sha256(b"other").hexdigest()
+
+    utils.download_and_extract_tar(url, tmp_path.joinpath("good"), sha256=hashlib.sha256(content).hexdigest())
+    with pytest.raises(DownloadError, match="SHA-256"):
+        utils.download_and_extract_tar(url, tmp_path.joinpath("bad"), sha256=wrong_sha256)
+    with pytest.raises(DownloadError, match="SHA-256"):
+        utils.download_file(url, tmp_path.joinpath("archive-copy.tar.gz"), sha256=wrong_sha256)
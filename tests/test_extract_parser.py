@@ -0,0 +1,42 @@
+"""Tests for the import-driven parsing of 'codeontology.rdfization.python3.extract.parser'."""
+
+import pytest
+
+astroid = pytest.importorskip("astroid")
+pytest.importorskip("docstring_parser")
+pytest.importorskip("tqdm")
+
+from codeontology.rdfization.python3.explore import Project
+from codeontology.rdfization.python3.extract.parser import Parser
+
+
+@pytest.fixture
+def astroid_cache():
+    astroid_cache = astroid.astroid_manager.MANAGER.astroid_cache
+    saved_astroid_cache = astroid_cache.copy()
+    yield astroid_cache
+    astroid_cache.clear()
+    astroid_cache.update(saved_astroid_cache)
+
+
+def test_failed_absolute_import_does_not_skip_relative_one(astroid_cache, monkeypatch, tmp_path):
+    files = {
+        "project/setup.py": "",
+        "pkgs/cotlib/__init__.py": "import cotdep\n",
+        # The absolute import fails, while the relative one with the same name resolves to a module of the dependency
+        "deps/cotdep/__init__.py": "import cothelpers\nfrom .cothelpers import VALUE\n",
+        "deps/cotdep/cothelpers.py": "VALUE = 1\n",
+        "stdlib/os.py": "",
+    }
+    for rel_path, content in files.items():
+        tmp_path.joinpath(rel_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(rel_path).write_text(content, encoding="utf8")
+    for search_path in ["deps", "pkgs"]:
+        monkeypatch.syspath_prepend(str(tmp_path.joinpath(search_path)))
+    project = Project("project", tmp_path.joinpath("project"), tmp_path.joinpath("pkgs"), tmp_path.joinpath("deps"),
+                      tmp_path.joinpath("stdlib"))
+
+    parser = Parser(project)
+
+    assert tmp_path.joinpath("deps/cotdep/__init__.py") in parser.parsed_packages
+    assert tmp_path.joinpath("deps/cotdep/cothelpers.py") in parser.parsed_packages